@@ -0,0 +1,85 @@
+"""
+Counts the multiplications performed by one Gfp12.mul and times it, for the
+schoolbook formulas the tower used to have and for the Karatsuba formulas it
+uses now.
+
+    python benchmarks/bench_tower.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bn256.constants import P  # noqa: E402
+from bn256.gfp12 import Gfp12  # noqa: E402
+from bn256.gfp2 import Gfp2  # noqa: E402
+from bn256.gfp6 import Gfp6  # noqa: E402
+
+KARATSUBA_GFP2_MUL = Gfp2.mul
+KARATSUBA_GFP12_MUL = Gfp12.mul
+
+
+def schoolbook_gfp2_mul(self: Gfp2, other: Gfp2) -> Gfp2:
+    x = (self.x * other.y + other.x * self.y) % P
+    y = (self.y * other.y - self.x * other.x) % P
+    return Gfp2(x, y)
+
+
+def schoolbook_gfp12_mul(self: Gfp12, other: Gfp12) -> Gfp12:
+    x = (self.x * other.y) + (other.x * self.y)
+    y = (self.y * other.y) + (self.x * other.x).mul_tau()
+    return Gfp12(x, y)
+
+
+def random_gfp12() -> Gfp12:
+    return Gfp12(
+        Gfp6(*[Gfp2(random.randrange(P), random.randrange(P)) for _ in range(3)]),
+        Gfp6(*[Gfp2(random.randrange(P), random.randrange(P)) for _ in range(3)]),
+    )
+
+
+def count(gfp2_mul, gfp12_mul, fp_per_gfp2_mul: int):
+    counts = {'gfp6': 0, 'gfp2': 0}
+    gfp6_mul = Gfp6.mul
+
+    def counting_gfp6_mul(self, other):
+        counts['gfp6'] += 1
+        return gfp6_mul(self, other)
+
+    def counting_gfp2_mul(self, other):
+        counts['gfp2'] += 1
+        return gfp2_mul(self, other)
+
+    Gfp6.mul, Gfp2.mul = counting_gfp6_mul, counting_gfp2_mul
+    try:
+        gfp12_mul(random_gfp12(), random_gfp12())
+    finally:
+        Gfp6.mul = gfp6_mul
+        Gfp2.mul = gfp2_mul
+    return counts['gfp6'], counts['gfp2'], counts['gfp2'] * fp_per_gfp2_mul
+
+
+def bench(gfp2_mul, gfp12_mul, number: int = 2000) -> float:
+    a, b = random_gfp12(), random_gfp12()
+    Gfp2.mul = gfp2_mul
+    try:
+        return timeit.timeit(lambda: gfp12_mul(a, b), number=number) / number * 1e6
+    finally:
+        Gfp2.mul = KARATSUBA_GFP2_MUL
+
+
+def main():
+    rows = [
+        ('schoolbook', schoolbook_gfp2_mul, schoolbook_gfp12_mul, 4),
+        ('karatsuba', KARATSUBA_GFP2_MUL, KARATSUBA_GFP12_MUL, 3),
+    ]
+    print('%-12s %9s %9s %7s %9s' % ('Gfp12.mul', 'Gfp6.mul', 'Gfp2.mul', 'Fp mul', 'us/op'))
+    for name, gfp2_mul, gfp12_mul, fp_per_gfp2_mul in rows:
+        gfp6, gfp2, fp = count(gfp2_mul, gfp12_mul, fp_per_gfp2_mul)
+        print('%-12s %9d %9d %7d %9.1f' % (name, gfp6, gfp2, fp, bench(gfp2_mul, gfp12_mul)))
+
+
+if __name__ == '__main__':
+    main()
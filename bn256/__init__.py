@@ -1,3 +1,4 @@
 from .gt import GT
 from .g1 import G1
 from .g2 import G2
+from .optate import G2Prepared
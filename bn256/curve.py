@@ -1,8 +1,18 @@
-from .constants import P
-from .utils import bits_of, mod_inverse, nums_to_bytes
+from typing import List
+
+from .constants import P, ORDER
+from .lattice import CURVE_LATTICE
+from .multiexp import WNAF_WINDOW, interleaved_wnaf
+from .utils import BYTE_LEN, batch_mod_inverse, mod_inverse, nums_to_bytes
 
 CURVE_B = 3
 
+# CURVE_BETA is a primitive cube root of unity mod P. (x, y) → (β·x, y) is an
+# endomorphism of the curve that acts on G1 as multiplication by CURVE_LAMBDA,
+# a cube root of unity mod ORDER.
+CURVE_BETA = 2203960485148121921418603742825762020974279258880205651966
+CURVE_LAMBDA = 4407920970296243842393367215006156084916469457145843978461
+
 
 class CurvePoint(object):
     def __init__(self, x: int, y: int, z: int = 1, t: int = 1):
@@ -26,13 +36,13 @@ class CurvePoint(object):
         assert isinstance(other, CurvePoint)
         a = self.copy().make_affine()
         b = other.copy().make_affine()
-        return a.x == b.x and a.y == b.y
+        return (a.x - b.x) % P == 0 and (a.y - b.y) % P == 0
 
     def __ne__(self, other: "CurvePoint") -> bool:  # ✅
         assert isinstance(other, CurvePoint)
         a = self.copy().make_affine()
         b = other.copy().make_affine()
-        return a.x != b.x or a.y != b.y
+        return (a.x - b.x) % P != 0 or (a.y - b.y) % P != 0
 
     def __add__(self, other: "CurvePoint") -> "CurvePoint":  # ✅
         return self.add(other)
@@ -85,6 +95,10 @@ class CurvePoint(object):
     def is_infinity(self) -> bool:  # ✅
         return self.z == 0
 
+    def is_affine(self) -> bool:
+        """is_affine reports whether the point is stored with z=1, so additions can use add_mixed."""
+        return self.z == 1
+
     def is_on_curve(self) -> bool:  # ✅
         r = (self.y * self.y) - self.x * self.x * self.x - CURVE_B
         if r < 0 or r >= P:
@@ -98,6 +112,11 @@ class CurvePoint(object):
         if other.is_infinity():
             return self
 
+        if other.is_affine():
+            return self.add_mixed(other)
+        if self.is_affine():
+            return other.add_mixed(self)
+
         # z1² mod P
         z1z1 = (self.z * self.z) % P
         # z2² mod P
@@ -136,6 +155,39 @@ class CurvePoint(object):
 
         return CurvePoint(x, y, z)
 
+    def add_mixed(self, other: "CurvePoint") -> "CurvePoint":
+        """
+        add_mixed returns self + other for an affine other (z=1). With z2=1
+        the z2², u1 and s1 products of add drop out.
+        """
+        assert other.is_affine()
+        if self.is_infinity():
+            return other
+
+        z1z1 = (self.z * self.z) % P
+        # h = x2 * z1² - x1
+        h = (other.x * z1z1 - self.x) % P
+        # r = y2 * z1³ - y1
+        r = (other.y * (self.z * z1z1 % P) - self.y) % P
+        if h == 0 and r == 0:
+            return self.double()
+
+        hh = (h * h) % P
+        _4h2 = hh + hh + hh + hh
+        _4h3 = (h * _4h2) % P
+        _2r = r + r
+        v = (self.x * _4h2) % P
+        x = (_2r * _2r) % P - _4h3 - (v + v)
+
+        t = (self.y * _4h3) % P
+        y = (_2r * (v - x)) % P - (t + t)
+
+        # z = (z1 + h)² - z1² - h² = 2h·z1
+        t = self.z + h
+        z = ((t * t) - z1z1 - hh) % P
+
+        return CurvePoint(x, y, z)
+
     def double(self) -> "CurvePoint":
         # A = x²
         x2 = (self.x * self.x) % P
@@ -167,16 +219,40 @@ class CurvePoint(object):
 
         return CurvePoint(x, y, z)
 
-    def mul_scalar(self, k: int) -> "CurvePoint":  # ✅
+    def mul_scalar(self, k: int, window: int = WNAF_WINDOW) -> "CurvePoint":  # ✅
+        """
+        mul_scalar returns k·self. k is reduced modulo ORDER and split with
+        CURVE_LATTICE into two halves of about 127 bits, k ≡ k₁ + k₂·λ, which are
+        processed in one width-window NAF pass over self and endomorphism(self).
+        Negative k multiplies the negated point.
+        """
         assert isinstance(k, int)
-        if int(k) == 0:
+        if k < 0:
+            return self.negative().mul_scalar(-k, window)
+        k %= ORDER
+        if k == 0:
             return CurvePoint.zero()
-        if int(k) == 1:
+        if k == 1:
             return self.copy()
-        r = CurvePoint.zero()
-        for b in [0] + bits_of(k):
-            r = r.double() + self if b != 0 else r.double()
-        return r
+        k1, k2 = CURVE_LATTICE.decompose(k)
+        return interleaved_wnaf([self, self.endomorphism()], [k1, k2], CurvePoint.zero(), window)
+
+    @classmethod
+    def double_scalar_mult(cls, a: int, p: "CurvePoint", b: int, q: "CurvePoint",
+                           window: int = WNAF_WINDOW) -> "CurvePoint":
+        """
+        double_scalar_mult returns a·p + b·q. Both scalars are split with
+        CURVE_LATTICE as in mul_scalar and the four halves share one doubling
+        chain of about 127 steps instead of two.
+        """
+        assert isinstance(a, int) and isinstance(b, int)
+        a1, a2 = CURVE_LATTICE.decompose(a % ORDER)
+        b1, b2 = CURVE_LATTICE.decompose(b % ORDER)
+        return interleaved_wnaf([p, p.endomorphism(), q, q.endomorphism()], [a1, a2, b1, b2], cls.zero(), window)
+
+    def endomorphism(self) -> "CurvePoint":
+        """endomorphism returns (β·x, y), which equals CURVE_LAMBDA·self."""
+        return CurvePoint(self.x * CURVE_BETA % P, self.y, self.z)
 
     def negative(self) -> "CurvePoint":  # ✅
         return CurvePoint(self.x, -self.y, self.z)
@@ -197,6 +273,68 @@ class CurvePoint(object):
         self.t = 1
         return self
 
+    @classmethod
+    def batch_make_affine(cls, points: List["CurvePoint"]) -> List["CurvePoint"]:
+        """
+        batch_make_affine returns new points equal to make_affine of every
+        input, sharing a single field inversion. The inputs are left untouched.
+        """
+        out = [p.copy() for p in points]
+        pending = []
+        for p in out:
+            if p.z == 1:
+                continue
+            if p.is_infinity():
+                p.set_one()
+            else:
+                pending.append(p)
+
+        z_invs = batch_mod_inverse([p.z for p in pending], P)
+        for p, z_inv in zip(pending, z_invs):
+            z_inv2 = (z_inv * z_inv) % P
+            p.x = (p.x * z_inv2) % P
+            p.y = ((p.y * z_inv) % P * z_inv2) % P
+            p.z = 1
+            p.t = 1
+        return out
+
+    @classmethod
+    def batch_sum(cls, points: List["CurvePoint"]) -> "CurvePoint":
+        """
+        batch_sum returns the sum of all points. They are added pairwise in a
+        tree with affine formulas, sharing one field inversion per level, so an
+        addition costs about six multiplications instead of a Jacobian add.
+        """
+        level = cls.batch_make_affine([p for p in points if not p.is_infinity()])
+        level = [(p.x % P, p.y % P) for p in level]
+        while len(level) > 1:
+            pairs, dens = [], []
+            for (x1, y1), (x2, y2) in zip(level[0::2], level[1::2]):
+                if x1 != x2:
+                    dens.append(x2 - x1)
+                elif y1 == y2:
+                    dens.append(y1 + y1)
+                else:
+                    # p + (-p) is the point at infinity.
+                    continue
+                pairs.append((x1, y1, x2, y2))
+
+            nxt = []
+            for (x1, y1, x2, y2), inv in zip(pairs, batch_mod_inverse(dens, P)):
+                if x1 != x2:
+                    lam = (y2 - y1) * inv % P
+                else:
+                    lam = 3 * x1 * x1 % P * inv % P
+                x3 = (lam * lam - x1 - x2) % P
+                nxt.append((x3, (lam * (x1 - x3) - y1) % P))
+            if len(level) % 2 == 1:
+                nxt.append(level[-1])
+            level = nxt
+
+        if not level:
+            return cls.zero()
+        return cls(level[0][0], level[0][1])
+
     def string(self) -> str:  # ✅
         copy = self.copy().make_affine()
         return "(%d,%d)" % (copy.x, copy.y)
@@ -205,9 +343,11 @@ class CurvePoint(object):
         return CurvePoint(self.x, self.y, self.z, self.t)
 
     def bytes(self) -> bytes:
+        if self.is_infinity():
+            return bytes(2 * BYTE_LEN)
         copy = self.copy()
         copy.make_affine()
-        return nums_to_bytes(copy.x, copy.y)
+        return nums_to_bytes(copy.x % P, copy.y % P)
 
 
 CURVE_G = CurvePoint(1, 2, 1, 1)
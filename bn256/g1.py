@@ -1,8 +1,17 @@
-from .curve import CurvePoint, CURVE_G
-from .utils import random_k, bytes_to_nums
+from typing import Iterable, List
+
+from .constants import ORDER, P
+from .curve import CURVE_B, CurvePoint, CURVE_G
+from .hash_to_curve import batch_hash_to_g1
+from .multiexp import FIXED_BASE_WINDOW, FixedBaseTable, pippenger
+from .utils import (BYTE_LEN, COMPRESSED_INFINITY, COMPRESSED_LARGEST, COMPRESSED_SMALLEST, bytes_to_nums,
+                    nums_to_bytes, random_k, set_flags, split_flags, sqrt_mod_p)
 
 
 class G1:
+    # Fixed-base table of CURVE_G, built on first use by precompute_base.
+    _base_table: FixedBaseTable = None
+
     def __init__(self, p: CurvePoint):
         self.p: CurvePoint = p
 
@@ -43,14 +52,85 @@ class G1:
         return k, cls.scalar_base_mult(k)
 
     @classmethod
-    def unmarshal(cls, data: bytes) -> "G1":  # ✅
+    def hash_to_point(cls, msg: bytes, dst: bytes) -> "G1":
+        """
+        hash_to_point hashes msg to G1 following RFC 9380 (BN254G1_XMD:SHA-256_SVDW_RO_)
+        under the domain separation tag dst.
+        """
+        return cls.batch_hash_to_point([msg], dst)[0]
+
+    @classmethod
+    def batch_hash_to_point(cls, msgs: List[bytes], dst: bytes) -> List["G1"]:
+        """batch_hash_to_point hashes every message like hash_to_point, sharing the inversions."""
+        return [cls(p) for p in batch_hash_to_g1(msgs, dst)]
+
+    @classmethod
+    def unmarshal(cls, data: bytes, trusted: bool = False) -> "G1":  # ✅
+        """
+        unmarshal decodes the output of marshal; all zeros is the point at
+        infinity. Unless trusted is set it raises ValueError for unreduced
+        coordinates or a point off the curve. G1 has cofactor 1, so every
+        point on the curve is in the group.
+        """
         x, y = bytes_to_nums(data, cnt=2)
+        if x == 0 and y == 0:
+            return G1(CurvePoint.zero())
         p = CurvePoint(x, y)
+        if not trusted:
+            if x >= P or y >= P:
+                raise ValueError("coordinate is not reduced modulo P")
+            if not p.is_on_curve():
+                raise ValueError("point is not on the curve")
         return G1(p)
 
+    @classmethod
+    def unmarshal_compressed(cls, data: bytes, trusted: bool = False) -> "G1":
+        """unmarshal_compressed decodes the output of marshal_compressed, raising ValueError on invalid data."""
+        return cls.batch_unmarshal_compressed([data], trusted)[0]
+
+    @classmethod
+    def batch_unmarshal_compressed(cls, data: List[bytes], trusted: bool = False) -> List["G1"]:
+        """
+        batch_unmarshal_compressed decodes many compressed points by solving
+        the curve equation for y; it mirrors G2.batch_unmarshal_compressed,
+        though each square root here is a single exponentiation. It raises
+        ValueError on malformed data or an x-coordinate that is not on the
+        curve. trusted is accepted for symmetry with G2: G1 has cofactor 1, so
+        there is no subgroup check to skip.
+        """
+        out = []
+        for d in data:
+            flags, d = split_flags(d, BYTE_LEN)
+            if flags == COMPRESSED_INFINITY:
+                out.append(cls(CurvePoint.zero()))
+                continue
+            x = bytes_to_nums(d, cnt=1)[0]
+            if x >= P:
+                raise ValueError("x-coordinate is not reduced modulo P")
+            y2 = (x * x % P * x + CURVE_B) % P
+            y = sqrt_mod_p(y2, P)
+            if y * y % P != y2:
+                raise ValueError("x-coordinate is not on the curve")
+            if (y > (P - 1) >> 1) != (flags == COMPRESSED_LARGEST):
+                y = P - y
+            out.append(cls(CurvePoint(x, y)))
+        return out
+
+    @classmethod
+    def precompute_base(cls, window: int = FIXED_BASE_WINDOW) -> FixedBaseTable:
+        """
+        precompute_base builds the fixed-base table used by scalar_base_mult.
+        A larger window trades memory (about 2^(window-1)·256/window points)
+        for fewer additions per multiplication.
+        """
+        cls._base_table = FixedBaseTable(CURVE_G, CurvePoint.zero(), window)
+        return cls._base_table
+
     @classmethod
     def scalar_base_mult(cls, k: int) -> "G1":  # ✅
-        p = cls.base().p.mul_scalar(k)
+        assert isinstance(k, int)
+        table = cls._base_table or cls.precompute_base()
+        p = table.mul(k % ORDER)
         return cls(p)
 
     def add(self, other: "G1") -> "G1":  # ✅
@@ -61,11 +141,57 @@ class G1:
     def marshal(self) -> bytes:  # ✅
         return self.p.bytes()
 
+    def marshal_compressed(self) -> bytes:
+        """
+        marshal_compressed returns the 32-byte x-coordinate with the sign of y
+        (COMPRESSED_SMALLEST or COMPRESSED_LARGEST) in its top two bits, or
+        COMPRESSED_INFINITY followed by zeros for the point at infinity.
+        """
+        if self.p.is_infinity():
+            return set_flags(bytes(BYTE_LEN), COMPRESSED_INFINITY)
+        p = self.p.copy().make_affine()
+        flags = COMPRESSED_LARGEST if p.y % P > (P - 1) >> 1 else COMPRESSED_SMALLEST
+        return set_flags(nums_to_bytes(p.x % P), flags)
+
+    @classmethod
+    def batch_marshal(cls, points: List["G1"]) -> List[bytes]:
+        """batch_marshal marshals all points, normalizing them with a single field inversion."""
+        affine = CurvePoint.batch_make_affine([g.p for g in points])
+        return [p.bytes() for p in affine]
+
     def scalar_mult(self, k: int) -> "G1":  # ✅
         assert isinstance(k, int)
         p = self.p.mul_scalar(k)
         return G1(p)
 
+    @classmethod
+    def sum(cls, points: Iterable["G1"]) -> "G1":
+        """
+        sum returns the sum of all points, e.g. for aggregating keys or
+        signatures. It is much faster than a chain of add calls for large sets.
+        """
+        p = CurvePoint.batch_sum([g.p for g in points])
+        return cls(p)
+
+    @classmethod
+    def double_scalar_mult(cls, a: int, p: "G1", b: int, q: "G1") -> "G1":
+        """
+        double_scalar_mult returns a·p + b·q with one shared doubling chain, as
+        needed by verification equations. It is about twice as fast as two
+        scalar_mult calls.
+        """
+        return cls(CurvePoint.double_scalar_mult(a, p.p, b, q.p))
+
+    @classmethod
+    def multi_scalar_mult(cls, points: List["G1"], scalars: List[int]) -> "G1":
+        """
+        multi_scalar_mult returns Σ kᵢ·Pᵢ using Pippenger's bucket method, which
+        is much faster than separate scalar_mult calls for many points.
+        """
+        assert len(points) == len(scalars)
+        p = pippenger([g.p for g in points], scalars, CurvePoint.zero())
+        return cls(p)
+
     def neg(self) -> "G1":  # ✅
         p = self.p.negative()
         return G1(p)
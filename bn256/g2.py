@@ -1,9 +1,18 @@
+from typing import Iterable, List
+
+from .constants import ORDER, P
 from .gfp2 import Gfp2
-from .twist import TwistPoint, TWIST_G
-from .utils import random_k, bytes_to_nums
+from .hash_to_curve import batch_hash_to_g2
+from .multiexp import FIXED_BASE_WINDOW, FixedBaseTable, pippenger
+from .optate import G2Prepared
+from .twist import TWIST_B, TwistPoint, TWIST_G
+from .utils import (BYTE_LEN, COMPRESSED_INFINITY, COMPRESSED_LARGEST, COMPRESSED_SMALLEST, bytes_to_nums,
+                    nums_to_bytes, random_k, set_flags, split_flags)
 
 
 class G2:
+    # Fixed-base table of TWIST_G, built on first use by precompute_base.
+    _base_table: FixedBaseTable = None
 
     def __init__(self, p: TwistPoint):
         self.p: TwistPoint = p
@@ -32,10 +41,17 @@ class G2:
     def base() -> "G2":
         return G2(TWIST_G)
 
+    @classmethod
+    def precompute_base(cls, window: int = FIXED_BASE_WINDOW) -> FixedBaseTable:
+        """precompute_base builds the TWIST_G table used by scalar_base_mult, as G1.precompute_base does."""
+        cls._base_table = FixedBaseTable(TWIST_G, TwistPoint.zero(), window)
+        return cls._base_table
+
     @classmethod
     def scalar_base_mult(cls, k: int) -> "G2":  # ✅
         assert isinstance(k, int)
-        p = cls.base().p.mul_scalar(k)
+        table = cls._base_table or cls.precompute_base()
+        p = table.mul(k % ORDER)
         return cls(p)
 
     @classmethod
@@ -43,6 +59,19 @@ class G2:
         k = random_k()
         return k, cls.scalar_base_mult(k)
 
+    @classmethod
+    def hash_to_point(cls, msg: bytes, dst: bytes) -> "G2":
+        """
+        hash_to_point hashes msg to G2 following RFC 9380 with expand_message_xmd/SHA-256,
+        the SvdW map on the twist and psi-based cofactor clearing, under the tag dst.
+        """
+        return cls.batch_hash_to_point([msg], dst)[0]
+
+    @classmethod
+    def batch_hash_to_point(cls, msgs: List[bytes], dst: bytes) -> List["G2"]:
+        """batch_hash_to_point hashes every message like hash_to_point, sharing the inversions and square roots."""
+        return [cls(p) for p in batch_hash_to_g2(msgs, dst)]
+
     def add(self, other: "G2") -> "G2":  # ✅
         assert isinstance(other, G2)
         # ?? a + b != b + a
@@ -53,15 +82,114 @@ class G2:
         p = self.p.mul_scalar(k)
         return G2(p)
 
+    @classmethod
+    def sum(cls, points: Iterable["G2"]) -> "G2":
+        """sum returns the sum of all points with batched affine additions."""
+        p = TwistPoint.batch_sum([g.p for g in points])
+        return cls(p)
+
+    @classmethod
+    def double_scalar_mult(cls, a: int, p: "G2", b: int, q: "G2") -> "G2":
+        """double_scalar_mult returns a·p + b·q with one shared doubling chain."""
+        return cls(TwistPoint.double_scalar_mult(a, p.p, b, q.p))
+
+    @classmethod
+    def multi_scalar_mult(cls, points: List["G2"], scalars: List[int]) -> "G2":
+        """multi_scalar_mult returns Σ kᵢ·Qᵢ using Pippenger's bucket method."""
+        assert len(points) == len(scalars)
+        p = pippenger([g.p for g in points], scalars, TwistPoint.zero())
+        return cls(p)
+
     def marshal(self) -> bytes:
         return self.p.bytes()
 
+    def marshal_compressed(self) -> bytes:
+        """
+        marshal_compressed returns the 64-byte x-coordinate with the flags of
+        G1.marshal_compressed; y is compared lexicographically, see
+        Gfp2.lexicographically_largest.
+        """
+        if self.p.is_infinity():
+            return set_flags(bytes(2 * BYTE_LEN), COMPRESSED_INFINITY)
+        p = self.p.copy().make_affine()
+        x = p.x.minimal()
+        flags = COMPRESSED_LARGEST if p.y.lexicographically_largest() else COMPRESSED_SMALLEST
+        return set_flags(nums_to_bytes(x.x, x.y), flags)
+
+    @classmethod
+    def unmarshal_compressed(cls, data: bytes, trusted: bool = False) -> "G2":
+        """unmarshal_compressed decodes the output of marshal_compressed, raising ValueError on invalid data."""
+        return cls.batch_unmarshal_compressed([data], trusted)[0]
+
     @classmethod
-    def unmarshal(cls, data: bytes) -> "G2":
-        xx, xy, yx, yy = bytes_to_nums(data, cnt=4)
-        p = TwistPoint(Gfp2(xx, xy), Gfp2(yx, yy))
+    def batch_unmarshal_compressed(cls, data: List[bytes], trusted: bool = False) -> List["G2"]:
+        """
+        batch_unmarshal_compressed decodes many compressed points. The square
+        roots of all y² values share one inversion, see Gfp2.batch_sqrt.
+        Unless trusted is set, every point is checked to be in G₂.
+        """
+        parsed = []
+        for d in data:
+            flags, d = split_flags(d, 2 * BYTE_LEN)
+            if flags == COMPRESSED_INFINITY:
+                parsed.append((flags, None))
+                continue
+            xx, xy = bytes_to_nums(d, cnt=2)
+            if xx >= P or xy >= P:
+                raise ValueError("x-coordinate is not reduced modulo P")
+            parsed.append((flags, Gfp2(xx, xy)))
+
+        xs = [x for _, x in parsed if x is not None]
+        try:
+            ys = iter(Gfp2.batch_sqrt([x.square() * x + TWIST_B for x in xs]))
+        except ValueError:
+            raise ValueError("x-coordinate is not on the twist curve")
+        out = []
+        for flags, x in parsed:
+            if x is None:
+                out.append(cls(TwistPoint.zero()))
+                continue
+            y = next(ys)
+            if y.lexicographically_largest() != (flags == COMPRESSED_LARGEST):
+                y = y.negative().minimal()
+            p = TwistPoint(x, y, Gfp2.one(), Gfp2.one())
+            if not trusted and not p.is_in_subgroup():
+                raise ValueError("point is not in G2")
+            out.append(cls(p))
+        return out
+
+    @classmethod
+    def batch_marshal(cls, points: List["G2"]) -> List[bytes]:
+        """batch_marshal marshals all points, normalizing them with a single field inversion."""
+        affine = TwistPoint.batch_make_affine([g.p for g in points])
+        return [p.bytes() for p in affine]
+
+    @classmethod
+    def unmarshal(cls, data: bytes, trusted: bool = False) -> "G2":
+        """
+        unmarshal decodes the output of marshal; all zeros is the point at
+        infinity. Unless trusted is set it raises ValueError for unreduced
+        coordinates, a point off the twist or a point outside G₂ (see
+        TwistPoint.is_in_subgroup).
+        """
+        nums = bytes_to_nums(data, cnt=4)
+        if not any(nums):
+            return G2(TwistPoint.zero())
+        xx, xy, yx, yy = nums
+        p = TwistPoint(Gfp2(xx, xy), Gfp2(yx, yy), Gfp2.one(), Gfp2.one())
+        if not trusted:
+            if any(n >= P for n in nums):
+                raise ValueError("coordinate is not reduced modulo P")
+            if not p.is_on_curve():
+                raise ValueError("point is not on the twist curve")
+            if not p.is_in_subgroup():
+                raise ValueError("point is not in G2")
         return G2(p)
 
+    def prepare(self) -> G2Prepared:
+        """prepare precomputes the Miller loop lines of a long-lived G2 value for GT.pair."""
+        return G2Prepared(self.p)
+
     def copy(self) -> "G2":
         p = self.p.copy()
         return G2(p)
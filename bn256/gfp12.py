@@ -1,6 +1,9 @@
+from typing import List, Tuple
+
+from .constants import P, U
 from .gfp6 import Gfp6
 from .gfp2 import Gfp2
-from .utils import bits_of
+from .utils import batch_mod_inverse, bits_of, wnaf
 
 XI_TO_P_MINUS_1_OVER_6 = Gfp2(
     16469823323077808223889137241176536799009286646108169935659301613961712198316,
@@ -9,6 +12,21 @@ XI_TO_P_MINUS_1_OVER_6 = Gfp2(
 
 XI_TO_P_SQUARED_MINUS_1_OVER_6 = 21888242871839275220042445260109153167277707414472061641714758635765020556617
 
+XI_TO_P_CUBED_MINUS_1_OVER_6 = Gfp2(
+    303847389135065887422783454877609941456349188919719272345083954437860409601,
+    11697423496358154304825782922584725312912383441159505038794027105778954184319,
+)
+
+# Default width of the signed-digit recoding used by cyclotomic_exp.
+CYCLOTOMIC_WINDOW = 4
+
+# U in width-4 NAF: 14 non-zero digits instead of 28 set bits, for exp_by_u.
+U_WNAF = wnaf(U, CYCLOTOMIC_WINDOW)
+
+# Karabina's compressed form of a cyclotomic element: the raw coordinates of
+# g2, g3, g4, g5 (x.z, y.x, y.y, x.x), each as (imaginary, real).
+Compressed = Tuple[int, int, int, int, int, int, int, int]
+
 
 class Gfp12(object):
     def __init__(self, x: Gfp6, y: Gfp6 = None):
@@ -76,6 +94,11 @@ class Gfp12(object):
         y = self.y.frobenius_p2()
         return Gfp12(x, y)
 
+    def frobenius_p3(self) -> "Gfp12":
+        x = self.x.frobenius_p3().mul_scalar(XI_TO_P_CUBED_MINUS_1_OVER_6)
+        y = self.y.frobenius_p3()
+        return Gfp12(x, y)
+
     def add(self, other: "Gfp12") -> "Gfp12":  # ✅
         assert isinstance(other, Gfp12)
         x = self.x + other.x
@@ -90,8 +113,22 @@ class Gfp12(object):
 
     def mul(self, other: "Gfp12") -> "Gfp12":  #
         assert isinstance(other, Gfp12)
-        x = (self.x * other.y) + (other.x * self.y)
-        y = (self.y * other.y) + (self.x * other.x).mul_tau()
+        # Karatsuba: (xω+y)(x'ω+y') = ((x+y)(x'+y') - xx' - yy')ω + (yy' + xx'τ)
+        v0 = self.x * other.x
+        v1 = self.y * other.y
+        x = (self.x + self.y) * (other.x + other.y) - v0 - v1
+        y = v1 + v0.mul_tau()
+        return Gfp12(x, y)
+
+    def mul_sparse(self, a: Gfp2, b: Gfp2, c: Gfp2) -> "Gfp12":
+        """
+        mul_sparse returns self * Gfp12(Gfp6(0, a, b), Gfp6(0, 0, c)), the shape
+        of the Miller loop lines, without multiplying by the zero coefficients.
+        """
+        a2 = self.x.mul_by_01(b, a)
+        yc = self.y.mul_scalar(c)
+        x = (self.x + self.y).mul_by_01(b + c, a) - a2 - yc
+        y = yc + a2.mul_tau()
         return Gfp12(x, y)
 
     def mul_scalar(self, k: Gfp6) -> "Gfp12":  # ✅
@@ -107,6 +144,171 @@ class Gfp12(object):
             r = r.square() * self if b != 0 else r.square()
         return r
 
+    def is_cyclotomic(self) -> bool:
+        """is_cyclotomic reports whether self^(p⁴-p²+1) = 1, i.e. self^(p⁴)·self = self^(p²)."""
+        if self.is_zero():
+            return False
+        f2 = self.frobenius_p2()
+        return f2.frobenius_p2().mul(self) == f2
+
+    def cyclotomic_exp(self, k: int, window: int = CYCLOTOMIC_WINDOW) -> "Gfp12":
+        """
+        cyclotomic_exp is exp for elements of the cyclotomic subgroup; negative
+        k is allowed. k is recoded in width-window NAF, and negative digits
+        multiply by conjugates, which are the inverses in this subgroup.
+        """
+        assert isinstance(k, int)
+        if k < 0:
+            return self.conjugate().cyclotomic_exp(-k, window)
+        return self._cyclotomic_exp_wnaf(wnaf(k, window), window)
+
+    def exp_by_u(self) -> "Gfp12":
+        """
+        exp_by_u returns self^U for an element of the cyclotomic subgroup. The
+        62 squarings run on Karabina's compressed form. self^(2^i) is kept for
+        every non-zero digit of U_WNAF, and all of these are decompressed with
+        one shared inversion. They are then collected per digit value, and the
+        buckets are combined as Π Bⱼ^(2j+1) = (Π Bⱼ^j)²·Π Bⱼ.
+        """
+        digits, cs = [], []
+        c = self.compress()
+        for i, d in enumerate(U_WNAF):
+            if i != 0:
+                c = Gfp12.compressed_square(c)
+            if d != 0:
+                digits.append(d)
+                cs.append(c)
+
+        buckets = [None] * (1 << (CYCLOTOMIC_WINDOW - 2))
+        for d, g in zip(digits, Gfp12.batch_decompress(cs)):
+            if d < 0:
+                g = g.conjugate()
+            j = abs(d) >> 1
+            buckets[j] = g if buckets[j] is None else buckets[j] * g
+
+        prod, acc = None, None
+        for j in range(len(buckets) - 1, -1, -1):
+            if buckets[j] is not None:
+                prod = buckets[j] if prod is None else prod * buckets[j]
+            if j != 0 and prod is not None:
+                acc = prod if acc is None else acc * prod
+        r = prod if acc is None else acc.cyclotomic_square() * prod
+        return Gfp12.one() if r is None else r
+
+    def compress(self) -> Compressed:
+        """compress returns Karabina's compressed form of an element of the cyclotomic subgroup."""
+        g2, g3, g4, g5 = self.x.z, self.y.x, self.y.y, self.x.x
+        return (g2.x % P, g2.y % P, g3.x % P, g3.y % P, g4.x % P, g4.y % P, g5.x % P, g5.y % P)
+
+    @staticmethod
+    def compressed_square(c: Compressed) -> Compressed:
+        """
+        compressed_square squares a compressed element: the g2..g5 part of
+        cyclotomic_square, which needs two GF(p⁴) squarings instead of three
+        (Karabina, http://eprint.iacr.org/2010/542.pdf). It works on the raw
+        coordinates to avoid building Gfp2 objects along long squaring chains.
+        """
+        g2x, g2y, g3x, g3y, g4x, g4y, g5x, g5y = c
+        # t4 = g4² + ξ·g5², p45 = g4·g5
+        s5x, s5y = 2 * g5x * g5y, (g5y - g5x) * (g5y + g5x)
+        t4x = 2 * g4x * g4y + 9 * s5x + s5y
+        t4y = (g4y - g4x) * (g4y + g4x) + 9 * s5y - s5x
+        p45x, p45y = g4x * g5y + g4y * g5x, g4y * g5y - g4x * g5x
+        # t2 = g2² + ξ·g3², p23 = g2·g3
+        s3x, s3y = 2 * g3x * g3y, (g3y - g3x) * (g3y + g3x)
+        t2x = 2 * g2x * g2y + 9 * s3x + s3y
+        t2y = (g2y - g2x) * (g2y + g2x) + 9 * s3y - s3x
+        p23x, p23y = g2x * g3y + g2y * g3x, g2y * g3y - g2x * g3x
+        # g2 = 2g2 + 6ξ·p45, g3 = 3t4 - 2g3, g4 = 3t2 - 2g4, g5 = 2g5 + 6p23
+        return ((2 * g2x + 6 * (9 * p45x + p45y)) % P, (2 * g2y + 6 * (9 * p45y - p45x)) % P,
+                (3 * t4x - 2 * g3x) % P, (3 * t4y - 2 * g3y) % P,
+                (3 * t2x - 2 * g4x) % P, (3 * t2y - 2 * g4y) % P,
+                (2 * g5x + 6 * p23x) % P, (2 * g5y + 6 * p23y) % P)
+
+    @classmethod
+    def batch_decompress(cls, cs: List[Compressed]) -> List["Gfp12"]:
+        """
+        batch_decompress recovers the cyclotomic elements of compressed forms:
+        g1 = (ξg5² + 3g4² - 2g3)/(4g2), or 2g4g5/g3 when g2 = 0, and
+        g0 = ξ(2g1² + g2g5 - 3g3g4) + 1. All divisions share one inversion.
+        """
+        parts = []
+        for g2x, g2y, g3x, g3y, g4x, g4y, g5x, g5y in cs:
+            if g2x or g2y:
+                s5x, s5y = 2 * g5x * g5y, (g5y - g5x) * (g5y + g5x)
+                nx = 9 * s5x + s5y + 6 * g4x * g4y - 2 * g3x
+                ny = 9 * s5y - s5x + 3 * (g4y - g4x) * (g4y + g4x) - 2 * g3y
+                parts.append((nx, ny, 4 * g2x, 4 * g2y))
+            else:
+                parts.append((2 * (g4x * g5y + g4y * g5x), 2 * (g4y * g5y - g4x * g5x), g3x, g3y))
+        # 1/d = conj(d)/|d|² in GF(p²); the identity compresses to zeros and
+        # gets g1 = 0, since batch_mod_inverse maps 0 to 0.
+        invs = batch_mod_inverse([dx * dx + dy * dy for _, _, dx, dy in parts], P)
+
+        out = []
+        for c, (nx, ny, dx, dy), inv in zip(cs, parts, invs):
+            g2x, g2y, g3x, g3y, g4x, g4y, g5x, g5y = c
+            ix, iy = -dx * inv % P, dy * inv % P
+            g1x, g1y = (nx * iy + ny * ix) % P, (ny * iy - nx * ix) % P
+            tx = 4 * g1x * g1y + g2x * g5y + g2y * g5x - 3 * (g3x * g4y + g3y * g4x)
+            ty = 2 * (g1y - g1x) * (g1y + g1x) + g2y * g5y - g2x * g5x - 3 * (g3y * g4y - g3x * g4x)
+            g0 = Gfp2((9 * tx + ty) % P, (9 * ty - tx + 1) % P)
+            out.append(cls(Gfp6(Gfp2(g5x, g5y), Gfp2(g1x, g1y), Gfp2(g2x, g2y)),
+                           Gfp6(Gfp2(g3x, g3y), Gfp2(g4x, g4y), g0)))
+        return out
+
+    def _cyclotomic_exp_wnaf(self, digits: List[int], window: int) -> "Gfp12":
+        # Odd powers self, self³, …, self^(2^(window-1) - 1) and their conjugates.
+        table = [self]
+        if any(abs(d) > 1 for d in digits):
+            sq = self.cyclotomic_square()
+            for _ in range((1 << (window - 2)) - 1):
+                table.append(table[-1] * sq)
+        conj = [t.conjugate() for t in table]
+
+        r = Gfp12.one()
+        for i in range(len(digits) - 1, -1, -1):
+            if i != len(digits) - 1:
+                r = r.cyclotomic_square()
+            d = digits[i]
+            if d > 0:
+                r = r * table[d >> 1]
+            elif d < 0:
+                r = r * conj[-d >> 1]
+        return r
+
+    def cyclotomic_square(self) -> "Gfp12":
+        """
+        cyclotomic_square squares an element of the cyclotomic subgroup, such as
+        the output of the easy part of the final exponentiation, with the
+        Granger–Scott formulas (http://eprint.iacr.org/2009/565.pdf). The result
+        is wrong for any other element.
+        """
+        z0, z4, z3 = self.y.z, self.y.y, self.y.x
+        z2, z1, z5 = self.x.z, self.x.y, self.x.x
+
+        # (z0 + z1·s)², (z2 + z3·s)², (z4 + z5·s)² in GF(p⁴) = GF(p²)[s]/(s² - ξ)
+        t0, t1 = _fp4_square(z0, z1)
+        t2, t3 = _fp4_square(z2, z3)
+        t4, t5 = _fp4_square(z4, z5)
+
+        # z0 = 3t0 - 2z0, z1 = 3t1 + 2z1
+        z0 = (t0 - z0).double() + t0
+        z1 = (t1 + z1).double() + t1
+        # z2 = 3ξt5 + 2z2, z3 = 3t4 - 2z3
+        t5 = t5.mul_xi()
+        z2 = (t5 + z2).double() + t5
+        z3 = (t4 - z3).double() + t4
+        # z4 = 3t2 - 2z4, z5 = 3t3 + 2z5
+        z4 = (t2 - z4).double() + t2
+        z5 = (t3 + z5).double() + t3
+
+        return Gfp12(Gfp6(z5, z1, z2), Gfp6(z3, z4, z0))
+
+    def cyclotomic_invert(self) -> "Gfp12":
+        """cyclotomic_invert inverts an element of the cyclotomic subgroup, where the inverse is the conjugate."""
+        return self.conjugate()
+
     def square(self) -> "Gfp12":  # ✅
         t = self.x * self.y
         x = t.double()
@@ -122,6 +324,27 @@ class Gfp12(object):
     def invert(self) -> "Gfp12":  # ✅
         return self.__invert__()
 
+    @classmethod
+    def batch_invert(cls, elems: List["Gfp12"]) -> List["Gfp12"]:
+        """
+        batch_invert inverts all elements with a single Gfp12 inversion
+        (Montgomery's trick). Zero elements map to zero.
+        """
+        prefix = []
+        acc = cls.one()
+        for e in elems:
+            prefix.append(acc)
+            if not e.is_zero():
+                acc = acc * e
+
+        inv = acc.invert()
+        out = [cls.zero() for _ in elems]
+        for i in range(len(elems) - 1, -1, -1):
+            if not elems[i].is_zero():
+                out[i] = inv * prefix[i]
+                inv = inv * elems[i]
+        return out
+
     def set_zero(self) -> "Gfp12":  # ✅
         self.x.set_zero()
         self.y.set_zero()
@@ -148,3 +371,10 @@ class Gfp12(object):
         self.x.minimal()
         self.y.minimal()
         return self
+
+
+def _fp4_square(a: Gfp2, b: Gfp2):
+    # (a + b·s)² = (a² + ξb²) + 2ab·s
+    a2 = a.square()
+    b2 = b.square()
+    return b2.mul_xi() + a2, (a + b).square() - a2 - b2
@@ -1,9 +1,24 @@
+from typing import List
+
 from .constants import P
+from .utils import batch_mod_inverse, bits_of, mod_inverse, sqrt_mod_p
 
-from .utils import bits_of, mod_inverse
+# Upper bound on the magnitude of lazily reduced coordinates fed into products.
+LAZY_BOUND = P << 16
 
 
 class Gfp2(object):
+    """
+    Gfp2 implements GF(p²) as xi+y with i²=-1.
+
+    Coordinates are reduced lazily. Products (mul, square, mul_scalar, invert)
+    reduce their result once into [0, P). The additive operations (add, sub,
+    double, negative, conjugate, mul_xi) never reduce: the tower and curve
+    formulas only chain a handful of them between two products, which keeps
+    every operand below LAZY_BOUND. Values are normalized with minimal() only
+    where the representation matters, i.e. comparisons and marshalling.
+    """
+
     def __init__(self, x: int, y: int):
         self.x: int = x
         self.y: int = y
@@ -89,14 +104,17 @@ class Gfp2(object):
 
     def sub(self, other: "Gfp2") -> "Gfp2":  # ✅
         assert isinstance(other, Gfp2)
-        x = (self.x - other.x) % P
-        y = (self.y - other.y) % P
-        return Gfp2((self.x - other.x), (self.y - other.y))
+        x = self.x - other.x
+        y = self.y - other.y
+        return Gfp2(x, y)
 
     def mul(self, other: "Gfp2") -> "Gfp2":  # ✅
         assert isinstance(other, Gfp2)
-        x = (self.x * other.y + other.x * self.y) % P
-        y = (self.y * other.y - self.x * other.x) % P
+        # Karatsuba: (xi+y)(x'i+y') = ((x+y)(x'+y') - yy' - xx')i + (yy' - xx')
+        v0 = self.y * other.y
+        v1 = self.x * other.x
+        x = ((self.x + self.y) * (other.x + other.y) - v0 - v1) % P
+        y = (v0 - v1) % P
         return Gfp2(x, y)
 
     def double(self) -> "Gfp2":  # ✅
@@ -105,8 +123,8 @@ class Gfp2(object):
         return Gfp2(x, y)
 
     def mul_scalar(self, k: int) -> "Gfp2":  # ✅
-        x = self.x * k
-        y = self.y * k
+        x = self.x * k % P
+        y = self.y * k % P
         return Gfp2(x, y)
 
     # Multiply by i+3
@@ -129,6 +147,65 @@ class Gfp2(object):
         y = (self.y * inv) % P
         return Gfp2(x, y)
 
+    @classmethod
+    def batch_invert(cls, elems: List["Gfp2"]) -> List["Gfp2"]:
+        """batch_invert inverts all elements with a single inversion in GF(p)."""
+        invs = batch_mod_inverse([e.y * e.y + e.x * e.x for e in elems], P)
+        return [cls((-e.x * inv) % P, (e.y * inv) % P) for e, inv in zip(elems, invs)]
+
+    def sqrt(self) -> "Gfp2":
+        """sqrt returns a square root of self and raises ValueError if there is none."""
+        return Gfp2.batch_sqrt([self])[0]
+
+    @classmethod
+    def batch_sqrt(cls, elems: List["Gfp2"]) -> List["Gfp2"]:
+        """
+        batch_sqrt returns a square root of every element, raising ValueError
+        if one is not a square. It uses the norm method for p ≡ 3 (mod 4): for
+        a = a₁i+a₀ with n = a₀²+a₁² = s², the root is a₁/(2x₀)·i + x₀ where
+        x₀² = (a₀±s)/2. The divisions by 2x₀ share one inversion.
+        """
+        half = (P + 1) >> 1
+        roots, dens = [], []
+        for e in elems:
+            a0, a1 = e.y % P, e.x % P
+            if a1 == 0:
+                # a is in GF(p): its root is either in GF(p) or a multiple of i.
+                r = sqrt_mod_p(a0, P)
+                if r * r % P == a0:
+                    roots.append((0, r))
+                else:
+                    roots.append((sqrt_mod_p(P - a0, P), 0))
+                dens.append(0)
+                continue
+
+            n = (a0 * a0 + a1 * a1) % P
+            s = sqrt_mod_p(n, P)
+            if s * s % P != n:
+                raise ValueError("%s is not a square in GF(p²)" % e)
+            t = (a0 + s) * half % P
+            x0 = sqrt_mod_p(t, P)
+            if x0 * x0 % P != t:
+                t = (a0 - s) * half % P
+                x0 = sqrt_mod_p(t, P)
+            roots.append((a1, x0))
+            dens.append(x0 + x0)
+
+        out = []
+        for (x, y), inv in zip(roots, batch_mod_inverse(dens, P)):
+            out.append(cls(x * inv % P, y) if inv else cls(x, y))
+        return out
+
+    def lexicographically_largest(self) -> bool:
+        """
+        lexicographically_largest reports whether self > -self when compared
+        as (x, y) pairs of integers in [0, P), i.e. the imaginary part first.
+        """
+        x, y = self.x % P, self.y % P
+        if x != 0:
+            return x > (P - 1) >> 1
+        return y > (P - 1) >> 1
+
     def exp(self, k: int) -> "Gfp2":  # ✅
         assert isinstance(k, int)
         r = Gfp2.one()
@@ -185,3 +262,13 @@ XI_TO_2P_MINUS_2_OVER_3 = Gfp2(
 )
 
 XI_TO_2P_SQUARED_MINUS_2_OVER_3 = 2203960485148121921418603742825762020974279258880205651966
+
+XI_TO_P_CUBED_MINUS_1_OVER_3 = Gfp2(
+    2236595495967245188281701248203181795121068902605861227855261137820944008926,
+    3772000881919853776433695186713858239009073593817195771773381919316419345261,
+)
+
+XI_TO_2P_CUBED_MINUS_2_OVER_3 = Gfp2(
+    16208900380737693084919495127334387981393726419856888799917914180988844123039,
+    5324479202449903542726783395506214481928257762400643279780343368557297135718,
+)
@@ -1,6 +1,8 @@
+from typing import List
 
-from .gfp2 import (Gfp2, XI_TO_2P_MINUS_2_OVER_3, XI_TO_P_MINUS_1_OVER_3, XI_TO_2P_SQUARED_MINUS_2_OVER_3,
-                   XI_TO_P_SQUARED_MINUS_1_OVER_3)
+
+from .gfp2 import (Gfp2, XI_TO_2P_CUBED_MINUS_2_OVER_3, XI_TO_2P_MINUS_2_OVER_3, XI_TO_P_CUBED_MINUS_1_OVER_3,
+                   XI_TO_P_MINUS_1_OVER_3, XI_TO_2P_SQUARED_MINUS_2_OVER_3, XI_TO_P_SQUARED_MINUS_1_OVER_3)
 
 
 class Gfp6(object):
@@ -102,6 +104,18 @@ class Gfp6(object):
 
         return Gfp6(x, y, z)
 
+    def mul_by_01(self, c0: Gfp2, c1: Gfp2) -> "Gfp6":
+        """mul_by_01 returns self * Gfp6(0, c1, c0) using five GF(p²) multiplications."""
+        assert isinstance(c0, Gfp2) and isinstance(c1, Gfp2)
+        v0 = self.z * c0
+        v1 = self.y * c1
+
+        x = self.x * c0 + v1
+        y = (self.y + self.z) * (c0 + c1) - v0 - v1
+        z = (self.x * c1).mul_xi() + v0
+
+        return Gfp6(x, y, z)
+
     def mul_scalar(self, k: Gfp2) -> "Gfp6":  # ✅
         assert isinstance(k, Gfp2)
 
@@ -159,6 +173,22 @@ class Gfp6(object):
         z = a * f
         return Gfp6(x, y, z)
 
+    @classmethod
+    def batch_invert(cls, elems: List["Gfp6"]) -> List["Gfp6"]:
+        """
+        batch_invert inverts all elements like invert, with one shared
+        inversion in GF(p) via Gfp2.batch_invert. Zero elements map to zero.
+        """
+        parts = []
+        for e in elems:
+            a = e.z.square() - (e.x * e.y).mul_xi()
+            b = e.x.square().mul_xi() - e.y * e.z
+            c = e.y.square() - e.x * e.z
+            parts.append((a, b, c, (c * e.y).mul_xi() + a * e.z + (b * e.x).mul_xi()))
+
+        invs = Gfp2.batch_invert([d for _, _, _, d in parts])
+        return [cls(c * f, b * f, a * f) for (a, b, c, _), f in zip(parts, invs)]
+
     def string(self) -> str:  # ✅
         return "(%s,%s,%s)" % (self.x, self.y, self.z)
 
@@ -183,6 +213,13 @@ class Gfp6(object):
         z = self.z
         return Gfp6(x, y, z)
 
+    def frobenius_p3(self) -> "Gfp6":
+        """frobenius_p3 computes self^(p³) directly instead of chaining frobenius and frobenius_p2."""
+        x = self.x.conjugate() * XI_TO_2P_CUBED_MINUS_2_OVER_3
+        y = self.y.conjugate() * XI_TO_P_CUBED_MINUS_1_OVER_3
+        z = self.z.conjugate()
+        return Gfp6(x, y, z)
+
     def copy(self) -> "Gfp6":
         return self.__copy__()
 
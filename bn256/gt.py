@@ -1,18 +1,206 @@
+from typing import List
+
 from .g1 import G1
-from .g2 import G2
-from .gfp12 import Gfp12, Gfp6, Gfp2
-from .optate import optimal_ate
-from .utils import nums_to_bytes, bytes_to_nums
+from .g2 import G2, G2Prepared
+from .gfp12 import CYCLOTOMIC_WINDOW, Gfp12, Gfp6, Gfp2
+from .lattice import TWIST_LATTICE
+from .multiexp import FIXED_BASE_WINDOW, bucket_window, signed_digits
+from .optate import final_exp, miller, multi_miller
+from .constants import ORDER, P, U
+from .utils import BYTE_LEN, nums_to_bytes, bytes_to_nums, random_k, wnaf
+
+# Compressed GT elements start with a format-version byte. The identity,
+# which has no torus representative, sets GT_COMPRESSED_IDENTITY in it and
+# carries zeros.
+GT_COMPRESSED_VERSION = 0x01
+GT_COMPRESSED_IDENTITY = 0x80
+GT_COMPRESSED_LEN = 1 + 6 * BYTE_LEN
+
+# Number of elements from which GT.multi_exp switches from interleaved
+# windows to the bucket method.
+GT_BUCKET_THRESHOLD = 24
+
+# τ as an element of GF(p⁶); ω² = τ in GF(p¹²).
+_TAU = Gfp6(Gfp2.zero(), Gfp2.one(), Gfp2.zero())
+
+
+def _mul(a: Gfp12, b: Gfp12) -> Gfp12:
+    # None stands for a factor of 1.
+    if a is None:
+        return b
+    return a if b is None else a.mul(b)
+
+
+def _odd_powers(g: Gfp12, count: int) -> List[Gfp12]:
+    """_odd_powers returns [g, g³, g⁵, …] with count entries for a cyclotomic g."""
+    g2 = g.cyclotomic_square()
+    table = [g]
+    for _ in range(count - 1):
+        table.append(table[-1] * g2)
+    return table
+
+
+def _interleaved_exp(tables: List[List[Gfp12]], scalars: List[int], window: int = CYCLOTOMIC_WINDOW) -> Gfp12:
+    """
+    _interleaved_exp returns Π gᵢ^kᵢ, where tables[i] holds the odd powers of
+    gᵢ from _odd_powers, with one shared chain of cyclotomic squarings over the
+    width-window NAFs of all scalars. Negative scalars use the conjugates.
+    """
+    terms = []
+    for table, k in zip(tables, scalars):
+        conj = [t.conjugate() for t in table]
+        if k < 0:
+            table, conj, k = conj, table, -k
+        if k != 0:
+            terms.append((wnaf(k, window), table, conj))
+
+    r = None
+    length = max([len(digits) for digits, _, _ in terms], default=0)
+    for i in range(length - 1, -1, -1):
+        if r is not None:
+            r = r.cyclotomic_square()
+        for digits, table, conj in terms:
+            if i < len(digits) and digits[i] != 0:
+                d = digits[i]
+                r = _mul(r, table[d >> 1] if d > 0 else conj[-d >> 1])
+    return Gfp12.one() if r is None else r
+
+
+def _bucket_exp(bases: List[Gfp12], scalars: List[int], window: int = None) -> Gfp12:
+    """
+    _bucket_exp is the GT counterpart of pippenger: it returns Π gᵢ^kᵢ with
+    signed base-2^window digits, multiplying the bases into one bucket per
+    digit value and combining the buckets with running products. Negative
+    scalars and digits use conjugates. The window is chosen by bucket_window
+    when not given.
+    """
+    terms = []
+    for g, k in zip(bases, scalars):
+        if k < 0:
+            g, k = g.conjugate(), -k
+        if k != 0:
+            terms.append((g, g.conjugate(), k))
+    if not terms:
+        return Gfp12.one()
+    c = window or bucket_window(len(terms), max(k for _, _, k in terms).bit_length())
+    terms = [(g, conj, signed_digits(k, c)) for g, conj, k in terms]
+    length = max(len(digits) for _, _, digits in terms)
+
+    r = None
+    for i in range(length - 1, -1, -1):
+        if r is not None:
+            for _ in range(c):
+                r = r.cyclotomic_square()
+        buckets = [None] * (1 << (c - 1))
+        for g, conj, digits in terms:
+            if i < len(digits) and digits[i] != 0:
+                d = digits[i]
+                j = abs(d) - 1
+                buckets[j] = _mul(buckets[j], g if d > 0 else conj)
+        # Π bucket[j]^(j+1) as a product of suffix products.
+        running, total = None, None
+        for b in reversed(buckets):
+            running = _mul(running, b)
+            total = _mul(total, running)
+        r = _mul(r, total)
+    return Gfp12.one() if r is None else r
+
+
+def _frobenius_tables(g: Gfp12, window: int = CYCLOTOMIC_WINDOW) -> List[List[Gfp12]]:
+    """
+    _frobenius_tables returns the odd-power tables of g, g^p, g^(p²) and
+    g^(p³); the last three are Frobenius images of the first.
+    """
+    tables = [_odd_powers(g, 1 << (window - 2))]
+    for _ in range(3):
+        tables.append([t.frobenius() for t in tables[-1]])
+    return tables
+
+
+def _frobenius_exp(g: Gfp12, k: int, window: int = CYCLOTOMIC_WINDOW) -> Gfp12:
+    """
+    _frobenius_exp returns g^k for g in GT. The Frobenius acts on GT as the
+    p-th power, so k is split with TWIST_LATTICE into four parts of about 64
+    bits, k ≡ Σ kᵢ·pⁱ, and g^k = Π (g^(pⁱ))^kᵢ costs a quarter of the
+    squarings.
+    """
+    return _interleaved_exp(_frobenius_tables(g, window), TWIST_LATTICE.decompose(k % ORDER), window)
+
+
+class GTBaseTable(object):
+    """
+    GTBaseTable is the GT counterpart of FixedBaseTable: it holds
+    g^(j·2^(window·i)) for every window position i and 1 ≤ j ≤ 2^(window-1),
+    so g^k is a product of one entry (or its conjugate) per window.
+    """
+
+    def __init__(self, base: Gfp12, window: int = FIXED_BASE_WINDOW, bits: int = ORDER.bit_length()):
+        assert window >= 2
+        self.window: int = window
+        count = 1 << (window - 1)
+        self.rows: List[List[Gfp12]] = []
+        # One extra window absorbs the carry of the signed recoding.
+        for _ in range(-(-bits // window) + 1):
+            row = [base]
+            for _ in range(count - 1):
+                row.append(row[-1] * base)
+            self.rows.append(row)
+            base = row[-1].cyclotomic_square()
+
+    def __repr__(self):
+        return "<GTBaseTable window=%d rows=%d>" % (self.window, len(self.rows))
+
+    def exp(self, k: int) -> Gfp12:
+        """exp returns base^k for 0 ≤ k < 2^bits."""
+        digits = signed_digits(k, self.window)
+        assert len(digits) <= len(self.rows)
+        r = None
+        for row, d in zip(self.rows, digits):
+            if d != 0:
+                r = _mul(r, row[d - 1] if d > 0 else row[-d - 1].conjugate())
+        return Gfp12.one() if r is None else r
 
 
 class GT(object):
+    """
+    GT is an element of the target group. It can be lazy: pair and
+    pair_product keep the raw Miller loop output, add multiplies raw values,
+    and the final exponentiation is only run when the value is needed (p,
+    marshal, __eq__, finalize). The element is final_exp(miller)·finished, so
+    lazy and finished values can be mixed freely.
+    """
+
+    # e(G1.base(), G2.base()) and its fixed-base table, computed on first use.
+    _base: Gfp12 = None
+    _base_table: GTBaseTable = None
 
-    def __init__(self, p: Gfp12):
-        self.p: Gfp12 = p
+    def __init__(self, p: Gfp12 = None, miller: Gfp12 = None):
+        self._p: Gfp12 = p
+        self._miller: Gfp12 = miller
+        # Set only on values returned by base(), so scalar_mult can use its table.
+        self._is_base: bool = False
 
     def __repr__(self):
         return '<Gt p=%s>' % self.p
 
+    @property
+    def p(self) -> Gfp12:
+        return self.finalize()._p
+
+    def is_lazy(self) -> bool:
+        """is_lazy reports whether self still holds a Miller value that has not been exponentiated."""
+        return self._miller is not None
+
+    def finalize(self) -> "GT":
+        """finalize runs the pending final exponentiation, if any, and returns self."""
+        if self._miller is not None:
+            f = final_exp(self._miller)
+            self._p = f if self._p is None else f.mul(self._p)
+            self._miller = None
+        elif self._p is None:
+            self._p = Gfp12.one()
+        return self
+
     def __add__(self, other: "GT") -> "GT":
         return self.add(other)
 
@@ -21,51 +209,228 @@ class GT(object):
 
     def __eq__(self, other: "GT") -> bool:
         assert isinstance(other, GT)
-        return self.p == other.p
+        if not self.is_lazy() and not other.is_lazy():
+            return self.p == other.p
+        # One final exponentiation of self·other⁻¹ instead of one per side.
+        return self.add(other.neg()).p.is_one()
 
     def __ne__(self, other: "GT") -> bool:
-        assert isinstance(other, GT)
-        return self.p != other.p
+        return not self == other
 
     @classmethod
     def base(cls) -> "GT":
-        return GT.pair(G1.base(), G2.base())
+        """
+        base returns e(G1.base(), G2.base()); the pairing is only computed once.
+        The result holds a copy of the cached value and is flagged so that
+        scalar_mult can use the fixed-base table.
+        """
+        if cls._base is None:
+            cls._base = GT.pair(G1.base(), G2.base()).p
+        gt = cls(cls._base.copy())
+        gt._is_base = True
+        return gt
+
+    @classmethod
+    def precompute_base(cls, window: int = FIXED_BASE_WINDOW) -> GTBaseTable:
+        """precompute_base builds the table of base() used by scalar_base_mult, as G1.precompute_base does."""
+        cls._base_table = GTBaseTable(cls.base().p, window)
+        return cls._base_table
+
+    @classmethod
+    def scalar_base_mult(cls, k: int) -> "GT":
+        """scalar_base_mult returns base()^k from the fixed-base table, without squarings."""
+        assert isinstance(k, int)
+        table = cls._base_table or cls.precompute_base()
+        return cls(table.exp(k % ORDER))
 
     @classmethod
     def random_gt(cls) -> (int, int, "GT"):
-        k1, g1 = G1.random_g1()
-        k2, g2 = G2.random_g2()
-        gt = GT.pair(g1, g2)
-        return k1, k2, gt
+        """random_gt returns k1, k2 and e(k1·G1, k2·G2) = base()^(k1·k2)."""
+        k1, k2 = random_k(), random_k()
+        return k1, k2, cls.scalar_base_mult(k1 * k2)
 
     def scalar_mult(self, k: int) -> "GT":  # ✅
+        """
+        scalar_mult returns self^k with the Frobenius decomposition of
+        _frobenius_exp, so self must be in GT. Values returned by base() go
+        through its fixed-base table; an equal element obtained some other way
+        takes the generic path.
+        """
         assert isinstance(k, int)
-        return GT(self.p.exp(k))
+        if self._is_base:
+            return GT.scalar_base_mult(k)
+        return GT(_frobenius_exp(self.p, k))
+
+    @classmethod
+    def multi_exp(cls, elements: List["GT"], scalars: List[int]) -> "GT":
+        """
+        multi_exp returns Π gᵢ^kᵢ for elements of GT, much faster than separate
+        scalar_mult calls. Every exponent is split with TWIST_LATTICE as in
+        scalar_mult and all parts share one chain of about 64 cyclotomic
+        squarings: interleaved windows are used below GT_BUCKET_THRESHOLD
+        elements and the bucket method from there on.
+        """
+        assert len(elements) == len(scalars)
+        pending = []
+        for e, k in zip(elements, scalars):
+            assert isinstance(e, GT) and isinstance(k, int)
+            if k % ORDER != 0:
+                pending.append((e.p, k % ORDER))
+
+        if len(pending) < GT_BUCKET_THRESHOLD:
+            tables, parts = [], []
+            for g, k in pending:
+                tables.extend(_frobenius_tables(g))
+                parts.extend(TWIST_LATTICE.decompose(k))
+            return cls(_interleaved_exp(tables, parts))
+
+        bases, parts = [], []
+        for g, k in pending:
+            bases.extend([g, g.frobenius(), g.frobenius_p2(), g.frobenius_p3()])
+            parts.extend(TWIST_LATTICE.decompose(k))
+        return cls(_bucket_exp(bases, parts))
 
     def add(self, other: "GT") -> "GT":
+        """add multiplies the finished parts and the pending Miller values separately."""
         assert isinstance(other, GT)
-        return GT(self.p.mul(other.p))
+        return GT(_mul(self._p, other._p), _mul(self._miller, other._miller))
 
     def neg(self) -> "GT":
-        return GT(~self.p)
+        # final_exp(f̄) = final_exp(f)⁻¹, so a pending Miller value is conjugated as well.
+        return GT(None if self._p is None else self._p.cyclotomic_invert(),
+                  None if self._miller is None else self._miller.conjugate())
 
     def marshal(self) -> bytes:  # ✅
         self.p.minimal()
         return nums_to_bytes(self.p.x.x.x, self.p.x.x.y, self.p.x.y.x, self.p.x.y.y, self.p.x.z.x, self.p.x.z.y,
                              self.p.y.x.x, self.p.y.x.y, self.p.y.y.x, self.p.y.y.y, self.p.y.z.x, self.p.y.z.y)
 
+    def marshal_compressed(self) -> bytes:
+        """
+        marshal_compressed returns the 193-byte T2 torus encoding of self, see
+        batch_marshal_compressed.
+        """
+        return GT.batch_marshal_compressed([self])[0]
+
+    @classmethod
+    def batch_marshal_compressed(cls, elems: List["GT"]) -> List[bytes]:
+        """
+        batch_marshal_compressed encodes elements of GT in compressed form.
+        An element g = y + xω ≠ 1 of the cyclotomic subgroup has norm 1 over
+        GF(p⁶) and is determined by c = (1 + y)/x ∈ GF(p⁶), since
+        g = (c + ω)/(c - ω). The output is the version byte followed by the
+        six coordinates of c; the divisions by x share one inversion.
+        """
+        x_invs = Gfp6.batch_invert([e.p.x for e in elems])
+        out = []
+        for e, x_inv in zip(elems, x_invs):
+            if e.p.x.is_zero():
+                if not e.p.is_one():
+                    raise ValueError("not an element of GT")
+                out.append(bytes([GT_COMPRESSED_VERSION | GT_COMPRESSED_IDENTITY]) + bytes(GT_COMPRESSED_LEN - 1))
+                continue
+            c = (e.p.y + Gfp6.one()).mul(x_inv).minimal()
+            out.append(bytes([GT_COMPRESSED_VERSION]) +
+                       nums_to_bytes(c.x.x, c.x.y, c.y.x, c.y.y, c.z.x, c.z.y))
+        return out
+
+    @classmethod
+    def unmarshal_compressed(cls, data: bytes, trusted: bool = False) -> "GT":
+        """unmarshal_compressed decodes the output of marshal_compressed, raising ValueError on invalid data."""
+        return cls.batch_unmarshal_compressed([data], trusted)[0]
+
+    @classmethod
+    def batch_unmarshal_compressed(cls, data: List[bytes], trusted: bool = False) -> List["GT"]:
+        """
+        batch_unmarshal_compressed decodes many compressed elements, computing
+        g = (c + ω)/(c - ω) = ((c² + τ) + 2cω)/(c² - τ). c² - τ is never zero as
+        τ is not a square in GF(p⁶), and all divisions share one inversion.
+        Unless trusted is set, every element is checked to be in GT.
+        """
+        cs = []
+        for d in data:
+            assert isinstance(d, bytes)
+            if len(d) != GT_COMPRESSED_LEN:
+                raise ValueError("compressed GT element must be %d bytes, got %d" % (GT_COMPRESSED_LEN, len(d)))
+            if d[0] == GT_COMPRESSED_VERSION | GT_COMPRESSED_IDENTITY and not any(d[1:]):
+                cs.append(None)
+                continue
+            if d[0] != GT_COMPRESSED_VERSION:
+                raise ValueError("unknown compressed GT format 0x%02x" % d[0])
+            nums = bytes_to_nums(d[1:], 6)
+            if any(n >= P for n in nums):
+                raise ValueError("coordinate is not reduced modulo P")
+            cs.append(Gfp6(Gfp2(nums[0], nums[1]), Gfp2(nums[2], nums[3]), Gfp2(nums[4], nums[5])))
+
+        squares = [c.square() for c in cs if c is not None]
+        invs = iter(Gfp6.batch_invert([c2 - _TAU for c2 in squares]))
+        squares = iter(squares)
+        out = []
+        for c in cs:
+            if c is None:
+                out.append(cls(Gfp12.one()))
+                continue
+            inv = next(invs)
+            gt = cls(Gfp12((c + c).mul(inv), (next(squares) + _TAU).mul(inv)))
+            if not trusted and not gt.is_in_subgroup():
+                raise ValueError("element is not in GT")
+            out.append(gt)
+        return out
+
     @classmethod
     def pair(cls, g1: G1, g2: G2) -> "GT":
+        """g2 may also be a G2Prepared returned by G2.prepare()."""
         assert isinstance(g1, G1)
-        assert isinstance(g2, G2)
-        p = optimal_ate(g2.p, g1.p)
-        return cls(p)
+        assert isinstance(g2, (G2, G2Prepared))
+        return cls(miller=miller(g2.p if isinstance(g2, G2) else g2, g1.p))
+
+    @classmethod
+    def pair_product(cls, pairs) -> "GT":
+        """
+        pair_product returns e(a₁,b₁)·e(a₂,b₂)·… for an iterable of (G1, G2)
+        pairs, evaluated with one shared Miller loop. The G2 side may be a
+        G2Prepared.
+        """
+        points = []
+        for g1, g2 in pairs:
+            assert isinstance(g1, G1)
+            assert isinstance(g2, (G2, G2Prepared))
+            points.append((g2.p if isinstance(g2, G2) else g2, g1.p))
+        return cls(miller=multi_miller(points))
+
+    @classmethod
+    def pairing_check(cls, pairs) -> bool:
+        """pairing_check reports whether e(a₁,b₁)·e(a₂,b₂)·… == 1."""
+        return cls.pair_product(pairs).p.is_one()
+
+    def is_in_subgroup(self) -> bool:
+        """
+        is_in_subgroup reports whether self lies in GT: it must be in the
+        cyclotomic subgroup and, like TwistPoint.is_in_subgroup with the
+        Frobenius in place of ψ, satisfy g^(u+1)·(g^u)^p·(g^u)^(p²) = (g^(2u))^(p³).
+        """
+        if self.p.is_zero() or not self.p.is_cyclotomic():
+            return False
+        gu = self.p.cyclotomic_exp(U)
+        lhs = gu.mul(self.p).mul(gu.frobenius()).mul(gu.frobenius_p2())
+        return lhs == gu.cyclotomic_square().frobenius_p2().frobenius()
 
     @classmethod
-    def unmarshal(cls, data: bytes) -> "GT":
-        p0_x, p0_y, p1_x, p1_y, p2_x, p2_y, p3_x, p3_y, p4_x, p4_y, p5_x, p5_y = bytes_to_nums(data, 12)
+    def unmarshal(cls, data: bytes, trusted: bool = False) -> "GT":
+        """
+        unmarshal decodes the output of marshal. Unless trusted is set it
+        raises ValueError for unreduced coordinates or an element outside GT.
+        """
+        nums = bytes_to_nums(data, 12)
+        p0_x, p0_y, p1_x, p1_y, p2_x, p2_y, p3_x, p3_y, p4_x, p4_y, p5_x, p5_y = nums
         p = Gfp12(
             Gfp6(Gfp2(p0_x, p0_y), Gfp2(p1_x, p1_y), Gfp2(p2_x, p2_y)),
             Gfp6(Gfp2(p3_x, p3_y), Gfp2(p4_x, p4_y), Gfp2(p5_x, p5_y)),
         )
-        return cls(p)
+        gt = cls(p)
+        if not trusted:
+            if any(n >= P for n in nums):
+                raise ValueError("coordinate is not reduced modulo P")
+            if not gt.is_in_subgroup():
+                raise ValueError("element is not in GT")
+        return gt
@@ -0,0 +1,215 @@
+import hashlib
+from typing import List
+
+from .constants import P, U
+from .curve import CURVE_B, CurvePoint
+from .gfp2 import Gfp2
+from .multiexp import interleaved_wnaf
+from .twist import TWIST_B, TwistPoint
+from .utils import batch_mod_inverse, sqrt_mod_p
+
+# Constants of the Shallue–van de Woestijne map (RFC 9380, section 6.6.1) for
+# y² = x³ + 3 with Z = 1: c1 = g(Z), c2 = -Z/2, c3 = sqrt(-g(Z)·3Z²) with
+# sgn0(c3) = 0 and c4 = -4·g(Z)/(3Z²).
+SVDW_Z = 1
+SVDW_C1 = 4
+SVDW_C2 = 10944121435919637611123202872628637544348155578648911831344518947322613104291
+SVDW_C3 = 8815841940592487685674414971303048083897117035520822607866
+SVDW_C4 = 7296080957279758407415468581752425029565437052432607887563012631548408736189
+
+# The same constants for the twist y² = x³ + 3/ξ over GF(p²). Z = 1 is the
+# first candidate accepted by the find_z_svdw procedure of RFC 9380.
+SVDW2_Z = Gfp2.one()
+SVDW2_C1 = Gfp2(
+    266929791119991161246907387137283842545076965332900288569378510910307636690,
+    19485874751759354771024239261021720505790618469301721065564631296452457478374,
+)
+SVDW2_C2 = Gfp2(0, SVDW_C2)
+SVDW2_C3 = Gfp2(
+    21819008332247140148575583693947636719449476128975323941588917397607662637108,
+    18992192239972082890849143911285057164064277369389217330423471574879236301292,
+)
+SVDW2_C4 = Gfp2(
+    6940174569119770192419592065569379906172001098655407502803841283667998553941,
+    10499238450719652342378357227399831140106360636427411350395554762472100376473,
+)
+
+# Bytes per field element in hash_to_field: ⌈(⌈log₂ P⌉ + 128) / 8⌉.
+HASH_TO_FIELD_LEN = 48
+
+
+def expand_message_xmd(msg: bytes, dst: bytes, length: int) -> bytes:
+    """expand_message_xmd returns length pseudo-random bytes for msg as in RFC 9380 with SHA-256."""
+    assert isinstance(msg, bytes) and isinstance(dst, bytes)
+    ell = -(-length // 32)
+    if ell > 255 or length > 65535 or len(dst) > 255:
+        raise ValueError("expand_message_xmd: length or dst too long")
+
+    dst_prime = dst + bytes([len(dst)])
+    msg_prime = bytes(64) + msg + length.to_bytes(2, "big") + b"\x00" + dst_prime
+    b0 = hashlib.sha256(msg_prime).digest()
+    b = [hashlib.sha256(b0 + b"\x01" + dst_prime).digest()]
+    for i in range(2, ell + 1):
+        chained = bytes(x ^ y for x, y in zip(b0, b[-1]))
+        b.append(hashlib.sha256(chained + bytes([i]) + dst_prime).digest())
+    return b"".join(b)[:length]
+
+
+def hash_to_field(msg: bytes, dst: bytes, count: int, degree: int = 1) -> List[int]:
+    """
+    hash_to_field returns count·degree integers modulo P derived from msg;
+    extension field elements take degree consecutive values.
+    """
+    data = expand_message_xmd(msg, dst, count * degree * HASH_TO_FIELD_LEN)
+    return [int.from_bytes(data[i:i + HASH_TO_FIELD_LEN], "big") % P
+            for i in range(0, len(data), HASH_TO_FIELD_LEN)]
+
+
+def _g(x: int) -> int:
+    return (x * x % P * x + CURVE_B) % P
+
+
+def _sqrt(a: int):
+    """_sqrt returns a square root of a, or None if a is not a square."""
+    r = sqrt_mod_p(a, P)
+    return r if r * r % P == a else None
+
+
+def batch_map_to_curve_svdw(us: List[int]) -> List[CurvePoint]:
+    """
+    batch_map_to_curve_svdw maps field elements to affine curve points with
+    the Shallue–van de Woestijne map. Each input takes a fixed sequence of
+    steps with no retries. The single inversion of the map is shared by all
+    inputs (Montgomery's trick), and every square root also serves as the
+    is-square test of the candidate x-coordinate, so an input needs at most
+    three exponentiations.
+    """
+    tv1s = [u * u % P * SVDW_C1 % P for u in us]
+    tv3s = batch_mod_inverse([(1 + tv1) * (1 - tv1) for tv1 in tv1s], P)
+
+    out = []
+    for u, tv1, tv3 in zip(us, tv1s, tv3s):
+        tv2 = 1 + tv1
+        tv4 = u * (1 - tv1) % P * tv3 % P * SVDW_C3 % P
+        x = (SVDW_C2 - tv4) % P
+        y = _sqrt(_g(x))
+        if y is None:
+            x = (SVDW_C2 + tv4) % P
+            y = _sqrt(_g(x))
+        if y is None:
+            x3 = tv2 * tv2 % P * tv3 % P
+            x = (x3 * x3 % P * SVDW_C4 + SVDW_Z) % P
+            y = _sqrt(_g(x))
+        # sgn0(y) must match sgn0(u).
+        if y % 2 != u % 2:
+            y = P - y
+        out.append(CurvePoint(x, y))
+    return out
+
+
+def map_to_curve_svdw(u: int) -> CurvePoint:
+    """map_to_curve_svdw maps one field element to a curve point, see batch_map_to_curve_svdw."""
+    return batch_map_to_curve_svdw([u])[0]
+
+
+def batch_hash_to_g1(msgs: List[bytes], dst: bytes) -> List[CurvePoint]:
+    """
+    batch_hash_to_g1 hashes every message to G1 (hash_to_curve of RFC 9380
+    with expand_message_xmd/SHA-256 and the SvdW map): two field elements
+    per message are mapped and added. G1 has cofactor 1, so no clearing is
+    needed, and the results are normalized with one shared inversion.
+    """
+    us = []
+    for msg in msgs:
+        us.extend(hash_to_field(msg, dst, 2))
+    qs = batch_map_to_curve_svdw(us)
+    return CurvePoint.batch_make_affine([qs[i].add(qs[i + 1]) for i in range(0, len(qs), 2)])
+
+
+def hash_to_g1(msg: bytes, dst: bytes) -> CurvePoint:
+    """hash_to_g1 hashes msg to a point of G1, see batch_hash_to_g1."""
+    return batch_hash_to_g1([msg], dst)[0]
+
+
+def _g2(x: Gfp2) -> Gfp2:
+    return x.square() * x + TWIST_B
+
+
+def _is_square2(a: Gfp2) -> bool:
+    # a is a square in GF(p²) exactly when its norm is a square in GF(p).
+    n = (a.x * a.x + a.y * a.y) % P
+    return pow(n, (P - 1) >> 1, P) != P - 1
+
+
+def _sgn0_2(a: Gfp2) -> int:
+    """_sgn0_2 is sgn0 of RFC 9380 for GF(p²): the parity of the real part, or of the imaginary one if it is 0."""
+    x, y = a.x % P, a.y % P
+    return y & 1 if y != 0 else x & 1
+
+
+def batch_map_to_twist_svdw(us: List[Gfp2]) -> List[TwistPoint]:
+    """
+    batch_map_to_twist_svdw maps elements of GF(p²) to affine points on the
+    twist with the Shallue–van de Woestijne map, like batch_map_to_curve_svdw.
+    The map's inversions share one inversion in GF(p), the candidates are
+    tested with the norm, and the square roots of the chosen g(x) are taken
+    together with Gfp2.batch_sqrt.
+    """
+    one = Gfp2.one()
+    tv1s = [u.square() * SVDW2_C1 for u in us]
+    tv3s = Gfp2.batch_invert([(one + tv1) * (one - tv1) for tv1 in tv1s])
+
+    xs = []
+    for u, tv1, tv3 in zip(us, tv1s, tv3s):
+        tv2 = one + tv1
+        tv4 = u * (one - tv1) * tv3 * SVDW2_C3
+        x = SVDW2_C2 - tv4
+        if not _is_square2(_g2(x)):
+            x = SVDW2_C2 + tv4
+            if not _is_square2(_g2(x)):
+                x3 = (tv2.square() * tv3).square()
+                x = x3 * SVDW2_C4 + SVDW2_Z
+        xs.append(x.minimal())
+
+    out = []
+    for u, x, y in zip(us, xs, Gfp2.batch_sqrt([_g2(x) for x in xs])):
+        if _sgn0_2(y) != _sgn0_2(u):
+            y = y.negative()
+        out.append(TwistPoint(x, y.minimal(), Gfp2.one(), Gfp2.one()))
+    return out
+
+
+def map_to_twist_svdw(u: Gfp2) -> TwistPoint:
+    """map_to_twist_svdw maps one element of GF(p²) to a twist point, see batch_map_to_twist_svdw."""
+    return batch_map_to_twist_svdw([u])[0]
+
+
+def clear_cofactor_g2(q: TwistPoint) -> TwistPoint:
+    """
+    clear_cofactor_g2 maps a twist point into G₂ with the Fuentes-Castañeda
+    et al. multiple of the cofactor, [u]Q + ψ([3u]Q) + ψ²([u]Q) + ψ³(Q). It
+    costs one 63-bit multiplication instead of a 256-bit one.
+    """
+    # mul_scalar assumes membership in G₂, so multiply without GLS.
+    uq = interleaved_wnaf([q], [U], TwistPoint.zero())
+    r = uq.add(uq.double().add(uq).psi())
+    return r.add(uq.psi().psi()).add(q.psi().psi().psi())
+
+
+def batch_hash_to_g2(msgs: List[bytes], dst: bytes) -> List[TwistPoint]:
+    """
+    batch_hash_to_g2 hashes every message to G₂ like batch_hash_to_g1, with
+    the SvdW map on the twist followed by clear_cofactor_g2.
+    """
+    us = []
+    for msg in msgs:
+        e = hash_to_field(msg, dst, 2, 2)
+        us.extend([Gfp2(e[1], e[0]), Gfp2(e[3], e[2])])
+    qs = batch_map_to_twist_svdw(us)
+    points = [clear_cofactor_g2(qs[i].add(qs[i + 1])) for i in range(0, len(qs), 2)]
+    return TwistPoint.batch_make_affine(points)
+
+
+def hash_to_g2(msg: bytes, dst: bytes) -> TwistPoint:
+    """hash_to_g2 hashes msg to a point of G₂, see batch_hash_to_g2."""
+    return batch_hash_to_g2([msg], dst)[0]
@@ -0,0 +1,67 @@
+from typing import List
+
+
+class Lattice(object):
+    """
+    Lattice is a reduced basis of {(a₀, …, aₙ₋₁) : Σ aᵢ·λⁱ ≡ 0 (mod ORDER)} for the
+    eigenvalue λ of an endomorphism. It splits a scalar k into short components
+    kᵢ with k ≡ Σ kᵢ·λⁱ (mod ORDER), so that k·P = Σ kᵢ·(λⁱ·P).
+    """
+
+    def __init__(self, vectors: List[List[int]], inverse: List[int], det: int):
+        assert len(vectors) == len(inverse)
+        self.vectors: List[List[int]] = vectors
+        # inverse is the first row of the adjugate of vectors, so the first row
+        # of the inverse basis is inverse / det.
+        self.inverse: List[int] = inverse
+        self.det: int = det
+
+    def __repr__(self):
+        return "<Lattice dim=%d>" % len(self.vectors)
+
+    def decompose(self, k: int) -> List[int]:
+        """
+        decompose writes (k, 0, …, 0) in the basis, rounds the coordinates to
+        the nearest integers and returns the difference to that lattice point.
+        """
+        n = len(self.vectors)
+        half = self.det >> 1
+        c = [(k * inv + half) // self.det for inv in self.inverse]
+        out = [k if i == 0 else 0 for i in range(n)]
+        for ci, v in zip(c, self.vectors):
+            for i in range(n):
+                out[i] -= ci * v[i]
+        return out
+
+
+# CURVE_LATTICE decomposes G1 scalars for the endomorphism (x, y) → (β·x, y),
+# whose eigenvalue is CURVE_LAMBDA. Both vectors are about 127 bits long:
+# (2U+1, -(6U²+2U)) and (6U²+4U+1, 2U+1).
+CURVE_LATTICE = Lattice(
+    vectors=[
+        [9931322734385697763, -147946756881789319000765030803803410728],
+        [147946756881789319010696353538189108491, 9931322734385697763],
+    ],
+    inverse=[9931322734385697763, 147946756881789319000765030803803410728],
+    det=21888242871839275222246405745257275088548364400416034343698204186575808495617,
+)
+
+
+# TWIST_LATTICE decomposes G2 scalars for the Frobenius endomorphism ψ, whose
+# eigenvalue on G₂ is P ≡ 6U² (mod ORDER). All components of the basis are
+# about 64 bits, so the four parts of a decomposed scalar are as well.
+TWIST_LATTICE = Lattice(
+    vectors=[
+        [9931322734385697763, 0, 9931322734385697762, 1],
+        [9931322734385697762, 4965661367192848882, -4965661367192848881, 4965661367192848881],
+        [4965661367192848882, 4965661367192848881, 4965661367192848881, -9931322734385697762],
+        [9931322734385697763, -4965661367192848881, -4965661367192848882, -4965661367192848881],
+    ],
+    inverse=[
+        734653495049373973806201247608587340319794091592875701774,
+        734653495049373973658254490726798021314063399421879442165,
+        9931322734385697763,
+        734653495049373973806201247608587340314828430225682852893,
+    ],
+    det=21888242871839275222246405745257275088548364400416034343698204186575808495617,
+)
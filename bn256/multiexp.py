@@ -0,0 +1,171 @@
+from typing import List
+
+from .constants import ORDER
+from .utils import wnaf
+
+# Default width of the wNAF recoding used by the scalar multiplications.
+WNAF_WINDOW = 5
+
+# Default window of the fixed-base tables. A table holds ⌈256/w⌉·2^(w-1)
+# points and a multiplication costs about 256/w additions and no doublings.
+FIXED_BASE_WINDOW = 6
+
+
+def odd_multiples(p, count: int) -> list:
+    """odd_multiples returns [p, 3p, 5p, …] with count entries."""
+    p2 = p.double()
+    table = [p]
+    for _ in range(count - 1):
+        table.append(table[-1].add(p2))
+    return table
+
+
+def interleaved_wnaf(points: list, scalars: List[int], zero, window: int = WNAF_WINDOW):
+    """
+    interleaved_wnaf computes Σ kᵢ·Pᵢ for CurvePoints or TwistPoints with a
+    single doubling chain: every scalar is recoded in width-window NAF and the
+    digits of all scalars are added in from a per-point table of odd multiples,
+    normalized to affine form with one shared inversion. Negative scalars are
+    handled by negating the point.
+    """
+    assert len(points) == len(scalars)
+    count = 1 << (window - 2)
+
+    digits, tables = [], []
+    for p, k in zip(points, scalars):
+        if k < 0:
+            p, k = p.negative(), -k
+        if k == 0 or p.is_infinity():
+            continue
+        digits.append(wnaf(k, window))
+        tables.append(odd_multiples(p, count))
+
+    # Affine tables let every addition below use add_mixed.
+    flat = type(zero).batch_make_affine([q for table in tables for q in table])
+    terms = []
+    for i, d in enumerate(digits):
+        table = flat[i * count:(i + 1) * count]
+        terms.append((d, table, [q.negative() for q in table]))
+
+    r = zero
+    length = max([len(digits) for digits, _, _ in terms], default=0)
+    for i in range(length - 1, -1, -1):
+        if not r.is_infinity():
+            r = r.double()
+        for digits, table, neg_table in terms:
+            if i < len(digits) and digits[i] != 0:
+                d = digits[i]
+                r = r.add(table[d >> 1] if d > 0 else neg_table[-d >> 1])
+    return r
+
+
+def bucket_window(n: int, bits: int = ORDER.bit_length()) -> int:
+    """
+    bucket_window returns the Pippenger window c that minimises the number of
+    additions, ⌈bits/c⌉·(n + 2^c), for n points with signed digits.
+    """
+    return min(range(2, 21), key=lambda c: -(-bits // c) * (n + (1 << c)))
+
+
+def pippenger(points: list, scalars: List[int], zero, window: int = None):
+    """
+    pippenger computes Σ kᵢ·Pᵢ with the bucket method. Scalars are reduced
+    modulo ORDER and recoded into signed base-2^window digits. The points are
+    normalized to affine form with one shared inversion; for every digit
+    position they are added into one Jacobian bucket per digit value, and the
+    buckets are combined with a running sum. The window is
+    chosen by bucket_window when not given.
+    """
+    assert len(points) == len(scalars)
+    pending = []
+    for p, k in zip(points, scalars):
+        k %= ORDER
+        if k == 0 or p.is_infinity():
+            continue
+        pending.append((p, k))
+    if not pending:
+        return zero
+
+    # Affine inputs let every bucket accumulation use add_mixed.
+    affine = type(zero).batch_make_affine([p for p, _ in pending])
+    c = window or bucket_window(len(pending))
+    terms = [(p, p.negative(), signed_digits(k, c)) for p, (_, k) in zip(affine, pending)]
+    length = max(len(digits) for _, _, digits in terms)
+
+    r = zero
+    for i in range(length - 1, -1, -1):
+        if not r.is_infinity():
+            for _ in range(c):
+                r = r.double()
+        buckets = [zero] * (1 << (c - 1))
+        for p, neg, digits in terms:
+            if i < len(digits) and digits[i] != 0:
+                d = digits[i]
+                if d > 0:
+                    buckets[d - 1] = buckets[d - 1].add(p)
+                else:
+                    buckets[-d - 1] = buckets[-d - 1].add(neg)
+        # Σ j·bucket[j] as a sum of suffix sums.
+        running, total = zero, zero
+        for b in reversed(buckets):
+            running = running.add(b)
+            total = total.add(running)
+        r = r.add(total)
+    return r
+
+
+def signed_digits(k: int, window: int) -> List[int]:
+    """
+    signed_digits returns the base-2^window digits of k ≥ 0, least significant
+    first, recoded into the range [-2^(window-1), 2^(window-1)).
+    """
+    assert k >= 0 and window >= 2
+    digits = []
+    radix = 1 << window
+    half = radix >> 1
+    while k:
+        d = k & (radix - 1)
+        if d >= half:
+            d -= radix
+        digits.append(d)
+        k = (k - d) >> window
+    return digits
+
+
+class FixedBaseTable(object):
+    """
+    FixedBaseTable holds j·2^(window·i)·base for every position i of a
+    windowed scalar and every 1 ≤ j ≤ 2^(window-1), in affine form. With it
+    k·base is a sum of one table entry (or its negative) per window.
+    """
+
+    def __init__(self, base, zero, window: int = FIXED_BASE_WINDOW, bits: int = ORDER.bit_length()):
+        assert window >= 2
+        self.window: int = window
+        self.zero = zero
+        count = 1 << (window - 1)
+        rows = []
+        # One extra window absorbs the carry of the signed recoding.
+        for _ in range(-(-bits // window) + 1):
+            row = [base]
+            for _ in range(count - 1):
+                row.append(row[-1].add(base))
+            rows.append(row)
+            base = row[-1].double()
+        flat = type(zero).batch_make_affine([p for row in rows for p in row])
+        self.rows: list = [flat[i:i + count] for i in range(0, len(flat), count)]
+
+    def __repr__(self):
+        return "<FixedBaseTable window=%d rows=%d>" % (self.window, len(self.rows))
+
+    def mul(self, k: int):
+        """mul returns k·base for 0 ≤ k < 2^bits."""
+        digits = signed_digits(k, self.window)
+        assert len(digits) <= len(self.rows)
+        r = self.zero
+        for row, d in zip(self.rows, digits):
+            if d == 0:
+                continue
+            q = row[d - 1] if d > 0 else row[-d - 1].negative()
+            r = q.copy() if r.is_infinity() else r.add(q)
+        return r
@@ -1,8 +1,7 @@
 from .constants import U, P
 from .curve import CurvePoint
 from .gfp12 import Gfp12
-from .gfp2 import (Gfp2, XI_TO_P_MINUS_1_OVER_2, XI_TO_P_MINUS_1_OVER_3, XI_TO_P_SQUARED_MINUS_1_OVER_3)
-from .gfp6 import Gfp6
+from .gfp2 import Gfp2, XI_TO_P_SQUARED_MINUS_1_OVER_3
 from .twist import TwistPoint
 
 # 6u+2 in NAF
@@ -16,6 +15,15 @@ def line_func_add(r: TwistPoint, p: TwistPoint, q: CurvePoint, r2: Gfp2):  # ✅
     assert isinstance(q, CurvePoint)
     assert isinstance(r2, Gfp2)
 
+    a, b, c, r_out = line_coeffs_add(r, p, r2)
+    return a, b.mul_scalar(q.x), c.mul_scalar(q.y), r_out
+
+
+def line_coeffs_add(r: TwistPoint, p: TwistPoint, r2: Gfp2):
+    """
+    line_coeffs_add is the twist-only half of line_func_add: the returned b and
+    c still have to be scaled by the x and y coordinates of the G1 point.
+    """
     B = p.x * r.t
     D = ((p.y + r.z).square() - r2 - r.t) * r.t
     H = B - r.x
@@ -32,8 +40,8 @@ def line_func_add(r: TwistPoint, p: TwistPoint, q: CurvePoint, r2: Gfp2):  # ✅
     r_out = TwistPoint(r_out_x, r_out_y, r_out_z, r_out_t)
 
     a = (L1 * p.x).double() - ((p.y + r_out_z).square() - r2 - r_out_t)
-    b = L1.negative().mul_scalar(q.x).double()
-    c = r_out_z.mul_scalar(q.y).double()
+    b = L1.negative().double()
+    c = r_out_z.double()
 
     return a, b, c, r_out
 
@@ -41,6 +49,16 @@ def line_func_add(r: TwistPoint, p: TwistPoint, q: CurvePoint, r2: Gfp2):  # ✅
 def line_func_double(r: TwistPoint, q: CurvePoint):
     assert isinstance(r, TwistPoint)
     assert isinstance(q, CurvePoint)
+
+    a, b, c, r_out = line_coeffs_double(r)
+    return a, b.mul_scalar(q.x), c.mul_scalar(q.y), r_out
+
+
+def line_coeffs_double(r: TwistPoint):
+    """
+    line_coeffs_double is the twist-only half of line_func_double: the returned
+    b and c still have to be scaled by the x and y coordinates of the G1 point.
+    """
     # A = x²
     A = r.x.square()
     # B = y²
@@ -66,11 +84,10 @@ def line_func_double(r: TwistPoint, q: CurvePoint):
 
     # a = (x + 3yx²)² - x² - 9y²x⁴ - 4y²
     a = (r.x + E).square() - A - G - B.double().double()
-    # b = (0 - 6tyx²) * k1
-
-    b = (Gfp2.zero() - (E * r.t).double()).mul_scalar(q.x)
-    # c = 2t((y + z)² - y² - t) * k2
-    c = (r_out_z * r.t).double().mul_scalar(q.y)
+    # b = 0 - 6tyx², scaled by k1 later
+    b = Gfp2.zero() - (E * r.t).double()
+    # c = 2t((y + z)² - y² - t), scaled by k2 later
+    c = (r_out_z * r.t).double()
 
     return a, b, c, r_out
 
@@ -81,87 +98,134 @@ def mul_line(r: Gfp12, a: Gfp2, b: Gfp2, c: Gfp2):  # ✅
     assert isinstance(b, Gfp2)
     assert isinstance(c, Gfp2)
 
-    a2 = Gfp6(Gfp2.zero(), a, b) * r.x
-    t2 = Gfp6(Gfp2.zero(), a, b + c)
-    yc = r.y.mul_scalar(c)
-    r.x = (r.x + r.y) * t2 - a2 - yc
-    r.y = yc + a2.mul_tau()
+    ret = r.mul_sparse(a, b, c)
+    r.x = ret.x
+    r.y = ret.y
 
 
-def miller(q: TwistPoint, p: CurvePoint):  # ❌
-    assert isinstance(q, TwistPoint)
+class G2Prepared(object):
+    """
+    G2Prepared holds the Miller loop line coefficients of a fixed TwistPoint.
+    The doubling and addition steps along NAF_6UP2, as well as the final Q1
+    and -Q2 additions, only depend on the twist point, so they are run once
+    here and a pairing with the prepared point only has to evaluate each line
+    at the G1 point.
+    """
+
+    def __init__(self, q: TwistPoint):
+        assert isinstance(q, TwistPoint)
+        self.coeffs = []
+        if q.is_infinity():
+            return
+
+        a_affine = q.copy().make_affine()
+        minus_a = -a_affine
+
+        r = a_affine.copy()
+        r2 = a_affine.y.square()
+
+        for index, naf_i in enumerate(NAF_6UP2[:-1]):
+            a, b, c, r = line_coeffs_double(r)
+            self.coeffs.append((a, b, c))
+
+            next_naf_i = NAF_6UP2[index + 1]
+            if next_naf_i == 1:
+                a, b, c, r = line_coeffs_add(r, a_affine, r2)
+            elif next_naf_i == -1:
+                a, b, c, r = line_coeffs_add(r, minus_a, r2)
+            else:
+                continue
+            self.coeffs.append((a, b, c))
+
+        # In order to calculate Q1 we have to convert q from the sextic twist
+        # to the full GF(p^12) group, apply the Frobenius there, and convert
+        # back.
+        #
+        # The twist isomorphism is (x', y') -> (xω², yω³). If we consider just
+        # x for a moment, then after applying the Frobenius, we have x̄ω^(2p)
+        # where x̄ is the conjugate of x. If we are going to apply the inverse
+        # isomorphism we need a value with a single coefficient of ω² so we
+        # rewrite this as x̄ω^(2p-2)ω². ξ⁶ = ω and, due to the construction of
+        # p, 2p-2 is a multiple of six. Therefore we can rewrite as
+        # x̄ξ^((p-1)/3)ω² and applying the inverse isomorphism eliminates the
+        # ω².
+        #
+        # A similar argument can be made for the y value.
+
+        q1 = a_affine.psi()
+
+        # For Q2 we are applying the p² Frobenius. The two conjugations cancel
+        # out and we are left only with the factors from the isomorphism. In
+        # the case of x, we end up with a pure number which is why
+        # xiToPSquaredMinus1Over3 is ∈ GF(p). With y we get a factor of -1. We
+        # ignore this to end up with -Q2.
+
+        minus_q2 = TwistPoint(
+            a_affine.x.mul_scalar(XI_TO_P_SQUARED_MINUS_1_OVER_3),
+            a_affine.y,
+            Gfp2.one(),
+            Gfp2.one()
+        )  # ✅
+
+        r2 = q1.y.square()
+        a, b, c, r = line_coeffs_add(r, q1, r2)
+        self.coeffs.append((a, b, c))
+
+        r2 = minus_q2.y.square()
+        a, b, c, r = line_coeffs_add(r, minus_q2, r2)
+        self.coeffs.append((a, b, c))
+
+    def __repr__(self):
+        return "<G2Prepared lines=%d>" % len(self.coeffs)
+
+    def is_infinity(self) -> bool:
+        return not self.coeffs
+
+
+def miller(q, p: CurvePoint):  # ❌
+    """miller accepts either a TwistPoint or a G2Prepared as q."""
+    assert isinstance(q, (TwistPoint, G2Prepared))
     assert isinstance(p, CurvePoint)
 
+    return multi_miller([(q, p)])
+
+
+def multi_miller(pairs) -> Gfp12:
+    """
+    multi_miller evaluates the Miller loops of several (q, CurvePoint) pairs at
+    once, where q is a TwistPoint or a G2Prepared. All loops walk NAF_6UP2 in
+    lockstep and share a single accumulator, so it is squared once per step
+    instead of once per pair. Pairs containing the point at infinity contribute
+    1 and are skipped.
+    """
     ret = Gfp12.one()
 
-    a_affine = q.copy().make_affine()
-    b_affine = p.copy().make_affine()
-    minus_a = -a_affine
+    loops = []
+    for q, p in pairs:
+        if isinstance(q, TwistPoint):
+            q = G2Prepared(q)
+        assert isinstance(q, G2Prepared)
+        assert isinstance(p, CurvePoint)
+        if q.is_infinity() or p.is_infinity():
+            continue
+        loops.append((q.coeffs, p.copy().make_affine()))
 
-    r = a_affine.copy()
-    r2 = a_affine.y.square()
+    if not loops:
+        return ret
 
+    i = 0
     for index, naf_i in enumerate(NAF_6UP2[:-1]):
-        a, b, c, new_r = line_func_double(r, b_affine)
         if index != 0:
             ret = ret.square()
-        mul_line(ret, a, b, c)
-
-        r = new_r
-        next_naf_i = NAF_6UP2[index + 1]
-        if next_naf_i == 1:
-            a, b, c, new_r = line_func_add(r, a_affine, b_affine, r2)
-        elif next_naf_i == -1:
-            a, b, c, new_r = line_func_add(r, minus_a, b_affine, r2)
-        else:
-            continue
-        mul_line(ret, a, b, c)
-        r = new_r
-
-    # In order to calculate Q1 we have to convert q from the sextic twist
-    # to the full GF(p^12) group, apply the Frobenius there, and convert
-    # back.
-    #
-    # The twist isomorphism is (x', y') -> (xω², yω³). If we consider just
-    # x for a moment, then after applying the Frobenius, we have x̄ω^(2p)
-    # where x̄ is the conjugate of x. If we are going to apply the inverse
-    # isomorphism we need a value with a single coefficient of ω² so we
-    # rewrite this as x̄ω^(2p-2)ω². ξ⁶ = ω and, due to the construction of
-    # p, 2p-2 is a multiple of six. Therefore we can rewrite as
-    # x̄ξ^((p-1)/3)ω² and applying the inverse isomorphism eliminates the
-    # ω².
-    #
-    # A similar argument can be made for the y value.
-
-    q1 = TwistPoint(
-        a_affine.x.conjugate().mul(XI_TO_P_MINUS_1_OVER_3),
-        a_affine.y.conjugate().mul(XI_TO_P_MINUS_1_OVER_2),
-        Gfp2.one(),
-        Gfp2.one()
-    )  # ✅
-
-    # For Q2 we are applying the p² Frobenius. The two conjugations cancel
-    # out and we are left only with the factors from the isomorphism. In
-    # the case of x, we end up with a pure number which is why
-    # xiToPSquaredMinus1Over3 is ∈ GF(p). With y we get a factor of -1. We
-    # ignore this to end up with -Q2.
-
-    minus_q2 = TwistPoint(
-        a_affine.x.mul_scalar(XI_TO_P_SQUARED_MINUS_1_OVER_3),
-        a_affine.y,
-        Gfp2.one(),
-        Gfp2.one()
-    )  # ✅
-
-    r2 = q1.y.square()
-    a, b, c, new_r = line_func_add(r, q1, b_affine, r2)  # ❌ ret
-    mul_line(ret, a, b, c)
-    r = new_r
-
-    r2 = minus_q2.y.square()
-    a, b, c, new_r = line_func_add(r, minus_q2, b_affine, r2)
-    mul_line(ret, a, b, c)
-    r = new_r
+        j = i + 1 if NAF_6UP2[index + 1] == 0 else i + 2
+        for coeffs, p in loops:
+            for a, b, c in coeffs[i:j]:
+                mul_line(ret, a, b.mul_scalar(p.x), c.mul_scalar(p.y))
+        i = j
+
+    for coeffs, p in loops:
+        for a, b, c in coeffs[i:]:
+            mul_line(ret, a, b.mul_scalar(p.x), c.mul_scalar(p.y))
     return ret
 
 
@@ -175,17 +239,24 @@ def final_exp(inp: Gfp12, u: int = U):  # ✅
 
     inv = inp.invert()
 
+    # After the easy part, t1 lies in the cyclotomic subgroup, so the hard part
+    # uses cyclotomic squarings and conjugates in place of inverses.
     t1 = inp.conjugate() * inv
     t2 = t1.frobenius_p2()
     t1 = t1 * t2
 
     fp1 = t1.frobenius()
     fp2 = t1.frobenius_p2()
-    fp3 = fp2.frobenius()
+    fp3 = t1.frobenius_p3()
 
-    fu1 = t1.exp(u)
-    fu2 = fu1.exp(u)
-    fu3 = fu2.exp(u)
+    if u == U:
+        fu1 = t1.exp_by_u()
+        fu2 = fu1.exp_by_u()
+        fu3 = fu2.exp_by_u()
+    else:
+        fu1 = t1.cyclotomic_exp(u)
+        fu2 = fu1.cyclotomic_exp(u)
+        fu3 = fu2.cyclotomic_exp(u)
 
     y3 = fu1.frobenius()
     fu2p = fu2.frobenius()
@@ -200,15 +271,15 @@ def final_exp(inp: Gfp12, u: int = U):  # ✅
     y5 = fu2.conjugate()
     y6 = (fu3 * fu3p).conjugate()
 
-    t0 = y6.square() * y4 * y5
-    t1 = ((y3 * y5 * t0).square() * t0 * y2).square()
+    t0 = y6.cyclotomic_square() * y4 * y5
+    t1 = ((y3 * y5 * t0).cyclotomic_square() * t0 * y2).cyclotomic_square()
 
-    ret = (t1 * y1).square() * (t1 * y0)
+    ret = (t1 * y1).cyclotomic_square() * (t1 * y0)
     return ret
 
 
-def optimal_ate(q: TwistPoint, p: CurvePoint) -> Gfp12:  # ✅
-    assert isinstance(q, TwistPoint)
+def optimal_ate(q, p: CurvePoint) -> Gfp12:  # ✅
+    assert isinstance(q, (TwistPoint, G2Prepared))
     assert isinstance(p, CurvePoint)
 
     e = miller(q, p)
@@ -1,5 +1,10 @@
-from .gfp2 import Gfp2
-from .utils import bits_of, nums_to_bytes
+from typing import List
+
+from .constants import ORDER, U
+from .gfp2 import Gfp2, XI_TO_P_MINUS_1_OVER_2, XI_TO_P_MINUS_1_OVER_3
+from .lattice import TWIST_LATTICE
+from .multiexp import WNAF_WINDOW, interleaved_wnaf
+from .utils import BYTE_LEN, nums_to_bytes
 
 TWIST_B = Gfp2(
     266929791119991161246907387137283842545076965332900288569378510910307636690,
@@ -84,6 +89,25 @@ class TwistPoint(object):
     def is_infinity(self) -> bool:  # ✅
         return self.z.is_zero()
 
+    def is_affine(self) -> bool:
+        """is_affine reports whether the point is stored with z=1, so additions can use add_mixed."""
+        return self.z.is_one()
+
+    def is_in_subgroup(self) -> bool:
+        """
+        is_in_subgroup reports whether the point lies in G₂ with Scott's test
+        [u+1]Q + ψ([u]Q) + ψ²([u]Q) = ψ³([2u]Q) instead of checking
+        [ORDER]Q = ∞. Its 63-bit multiplication runs without GLS, so the test
+        still costs more than half of a GLS scalar multiplication.
+        """
+        if self.is_infinity():
+            return True
+        # mul_scalar assumes membership in G₂, so multiply without GLS.
+        uq = interleaved_wnaf([self], [U], TwistPoint.zero())
+        psi_uq = uq.psi()
+        lhs = uq.add(self).add(psi_uq).add(psi_uq.psi())
+        return lhs == uq.double().psi().psi().psi()
+
     def is_on_curve(self) -> bool:  # ✅
         y2 = self.y.square()
         x2 = self.x.square()
@@ -100,6 +124,11 @@ class TwistPoint(object):
         if other.is_infinity():
             return self
 
+        if other.is_affine():
+            return self.add_mixed(other)
+        if self.is_affine():
+            return other.add_mixed(self)
+
         z1z1 = self.z.square()
         z2z2 = other.z.square()
 
@@ -131,16 +160,82 @@ class TwistPoint(object):
 
         return TwistPoint(x, y, z)
 
-    def mul_scalar(self, k: int) -> "TwistPoint":
+    def add_mixed(self, other: "TwistPoint") -> "TwistPoint":
+        """add_mixed returns self + other for an affine other (z=1), see CurvePoint.add_mixed."""
+        assert other.is_affine()
+        if self.is_infinity():
+            return other
+
+        z1z1 = self.z.square()
+        h = other.x * z1z1 - self.x
+        r = other.y * (self.z * z1z1) - self.y
+        if h.is_zero() and r.is_zero():
+            return self.double()
+
+        hh = h.square()
+        _4h2 = hh.double().double()
+        _4h3 = h * _4h2
+        _2r = r + r
+        v = self.x * _4h2
+        x = _2r.square() - _4h3 - (v + v)
+
+        t = self.y * _4h3
+        y = (_2r * (v - x)) - (t + t)
+
+        # z = (z1 + h)² - z1² - h² = 2h·z1
+        z = (self.z + h).square() - z1z1 - hh
+
+        return TwistPoint(x, y, z)
+
+    def mul_scalar(self, k: int, window: int = WNAF_WINDOW) -> "TwistPoint":
+        """
+        mul_scalar returns k·self. The point is assumed to be in G₂, so k is
+        reduced modulo ORDER and split with TWIST_LATTICE into four parts of
+        about 64 bits, k ≡ Σ kᵢ·pⁱ, which are processed in one width-window NAF
+        pass over self, ψ(self), ψ²(self) and ψ³(self). Negative k multiplies
+        the negated point.
+        """
         assert isinstance(k, int)
-        if int(k) == 0:
+        if k < 0:
+            return self.negative().mul_scalar(-k, window)
+        k %= ORDER
+        if k == 0:
             return TwistPoint.zero()
-        if int(k) == 1:
+        if k == 1:
             return self.copy()
-        r = TwistPoint.zero()
-        for b in [0] + bits_of(k):
-            r = r.double() + self if b != 0 else r.double()
-        return r
+        return interleaved_wnaf(self.psi_powers(), TWIST_LATTICE.decompose(k), TwistPoint.zero(), window)
+
+    @classmethod
+    def double_scalar_mult(cls, a: int, p: "TwistPoint", b: int, q: "TwistPoint",
+                           window: int = WNAF_WINDOW) -> "TwistPoint":
+        """
+        double_scalar_mult returns a·p + b·q for points in G₂. Both scalars are
+        split with TWIST_LATTICE as in mul_scalar and the eight parts share one
+        doubling chain of about 64 steps.
+        """
+        assert isinstance(a, int) and isinstance(b, int)
+        scalars = TWIST_LATTICE.decompose(a % ORDER) + TWIST_LATTICE.decompose(b % ORDER)
+        return interleaved_wnaf(p.psi_powers() + q.psi_powers(), scalars, cls.zero(), window)
+
+    def psi_powers(self) -> List["TwistPoint"]:
+        """psi_powers returns [self, ψ(self), ψ²(self), ψ³(self)]."""
+        points = [self]
+        for _ in range(3):
+            points.append(points[-1].psi())
+        return points
+
+    def psi(self) -> "TwistPoint":
+        """
+        psi returns ψ(self): the point is untwisted into GF(p¹²), the p-power
+        Frobenius is applied and the result is twisted back. On G₂, ψ acts as
+        multiplication by P.
+        """
+        return TwistPoint(
+            self.x.conjugate().mul(XI_TO_P_MINUS_1_OVER_3),
+            self.y.conjugate().mul(XI_TO_P_MINUS_1_OVER_2),
+            self.z.conjugate(),
+            self.t.conjugate(),
+        )
 
     def double(self) -> "TwistPoint":  # ✅
         x2 = self.x.square()
@@ -187,6 +282,64 @@ class TwistPoint(object):
         z = Gfp2.one()
         return TwistPoint(x, y, z)
 
+    @classmethod
+    def batch_make_affine(cls, points: List["TwistPoint"]) -> List["TwistPoint"]:
+        """
+        batch_make_affine returns new points equal to make_affine of every
+        input, sharing a single field inversion. The inputs are left untouched.
+        """
+        out = []
+        pending = []
+        for p in points:
+            if p.z.is_zero():
+                out.append(cls.one())
+            elif p.z.is_one():
+                out.append(p.copy())
+            else:
+                pending.append(len(out))
+                out.append(p)
+
+        z_invs = Gfp2.batch_invert([out[i].z for i in pending])
+        for i, z_inv in zip(pending, z_invs):
+            z_inv2 = z_inv.square()
+            z_inv3 = z_inv2 * z_inv
+            out[i] = cls(out[i].x * z_inv2, out[i].y * z_inv3, Gfp2.one(), Gfp2.one())
+        return out
+
+    @classmethod
+    def batch_sum(cls, points: List["TwistPoint"]) -> "TwistPoint":
+        """batch_sum returns the sum of all points with a tree of affine additions, see CurvePoint.batch_sum."""
+        level = cls.batch_make_affine([p for p in points if not p.is_infinity()])
+        level = [(p.x, p.y) for p in level]
+        while len(level) > 1:
+            pairs, dens = [], []
+            for (x1, y1), (x2, y2) in zip(level[0::2], level[1::2]):
+                if x1 != x2:
+                    dens.append(x2 - x1)
+                elif y1 == y2:
+                    dens.append(y1.double())
+                else:
+                    # q + (-q) is the point at infinity.
+                    continue
+                pairs.append((x1, y1, x2, y2))
+
+            nxt = []
+            for (x1, y1, x2, y2), inv in zip(pairs, Gfp2.batch_invert(dens)):
+                if x1 != x2:
+                    lam = (y2 - y1) * inv
+                else:
+                    x1x1 = x1.square()
+                    lam = (x1x1 + x1x1.double()) * inv
+                x3 = (lam.square() - x1 - x2).minimal()
+                nxt.append((x3, (lam * (x1 - x3) - y1).minimal()))
+            if len(level) % 2 == 1:
+                nxt.append(level[-1])
+            level = nxt
+
+        if not level:
+            return cls.zero()
+        return cls(level[0][0], level[0][1], Gfp2.one(), Gfp2.one())
+
     def string(self) -> str:
         copy = self.copy().make_affine()
         return "(%s,%s)" % (copy.x, copy.y)
@@ -195,7 +348,11 @@ class TwistPoint(object):
         return TwistPoint(self.x.copy(), self.y.copy(), self.z.copy(), self.t.copy())
 
     def bytes(self) -> bytes:
+        if self.is_infinity():
+            return bytes(4 * BYTE_LEN)
         copy = self.copy().make_affine()
+        copy.x.minimal()
+        copy.y.minimal()
         return nums_to_bytes(copy.x.x, copy.x.y, copy.y.x, copy.y.y)
 
 
@@ -6,11 +6,41 @@ from .constants import P, ORDER
 
 BYTE_LEN = 32
 
+# Flags stored in the two most significant bits of a compressed point, which
+# are always free since P < 2²⁵⁴.
+COMPRESSED_SMALLEST = 0b10 << 6
+COMPRESSED_LARGEST = 0b11 << 6
+COMPRESSED_INFINITY = 0b01 << 6
+COMPRESSED_MASK = 0b11 << 6
+
 
 def bits_of(k):
     return [int(c) for c in "{0:b}".format(k)]
 
 
+def wnaf(k: int, w: int) -> List[int]:
+    """
+    wnaf returns the width-w non-adjacent form of k ≥ 0, least significant digit
+    first. Every non-zero digit is odd with |d| < 2^(w-1), and any w consecutive
+    digits contain at most one non-zero digit.
+    """
+    assert k >= 0 and w >= 2
+    digits = []
+    mask = (1 << w) - 1
+    half = 1 << (w - 1)
+    while k:
+        if k & 1:
+            d = k & mask
+            if d >= half:
+                d -= 1 << w
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+
 def sqrt_mod_p(a: int, p: int):
     assert p % 4 == 3
     return pow(a, (p + 1) // 4, p)
@@ -22,6 +52,28 @@ def mod_inverse(a: int, p: int):
     return pow(a, p - 2, p)
 
 
+def batch_mod_inverse(values: List[int], p: int) -> List[int]:
+    """
+    batch_mod_inverse inverts every value with a single mod_inverse call
+    (Montgomery's trick). Zero values map to 0, like mod_inverse does.
+    """
+    prefix = []
+    acc = 1
+    for v in values:
+        prefix.append(acc)
+        if v % p != 0:
+            acc = acc * v % p
+
+    inv = mod_inverse(acc, p)
+    out = [0] * len(values)
+    for i in range(len(values) - 1, -1, -1):
+        v = values[i] % p
+        if v != 0:
+            out[i] = inv * prefix[i] % p
+            inv = inv * v % p
+    return out
+
+
 #
 def random_k() -> int:
     rand_elem_bytes = (ORDER.bit_length() + 7) // 8 + 1
@@ -46,3 +98,25 @@ def bytes_to_nums(data: bytes, cnt: int) -> List[int]:
     assert len(data) == BYTE_LEN * cnt
     return [int.from_bytes(data[BYTE_LEN * i: BYTE_LEN * (i + 1)], "big")
             for i in range(cnt)]
+
+
+def set_flags(data: bytes, flags: int) -> bytes:
+    """set_flags ors flags into the first byte of data."""
+    return bytes([data[0] | flags]) + data[1:]
+
+
+def split_flags(data: bytes, size: int) -> (int, bytes):
+    """
+    split_flags checks that data is a compressed point of size bytes and
+    returns its flags and the data with the flag bits cleared.
+    """
+    assert isinstance(data, bytes)
+    if len(data) != size:
+        raise ValueError("compressed point must be %d bytes, got %d" % (size, len(data)))
+    flags = data[0] & COMPRESSED_MASK
+    if flags == COMPRESSED_INFINITY:
+        if data[0] != COMPRESSED_INFINITY or any(data[1:]):
+            raise ValueError("invalid encoding of the point at infinity")
+    elif flags not in (COMPRESSED_SMALLEST, COMPRESSED_LARGEST):
+        raise ValueError("missing compression flag")
+    return flags, bytes([data[0] & ~COMPRESSED_MASK & 0xff]) + data[1:]
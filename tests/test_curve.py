@@ -1,4 +1,5 @@
-from bn256.curve import CurvePoint
+from bn256.constants import ORDER
+from bn256.curve import CURVE_G, CURVE_LAMBDA, CurvePoint
 from bn256.utils import bits_of
 
 
@@ -16,15 +17,19 @@ class TestCurvePoint:
 
     def test_curve_point_add(self):
         c1 = self.a + self.b
-        assert c1.x == -8030019297004030839387309015943663447814033459498803802815950552962657336198
-        assert c1.y == 17369015046471995974106459814434955140906951195137422436589153304383829678254
-        assert c1.z == 17258309029904047582215572897898954019212799630461057332267253245789321192076
+        assert c1 == CurvePoint(
+            -8030019297004030839387309015943663447814033459498803802815950552962657336198,
+            17369015046471995974106459814434955140906951195137422436589153304383829678254,
+            17258309029904047582215572897898954019212799630461057332267253245789321192076,
+        )
         assert c1.t == 0
 
         c2 = self.b.add(self.a)
-        assert c2.x == -29918262168843306061633714761200938536510344616796627465504988447607883544781
-        assert c2.y == -17369015046471995974106459814434955140906951195137422436589153304383829678254
-        assert c2.z == 4629933841935227640030832847358321069483511526836766330421784648855905016507
+        assert c2 == CurvePoint(
+            -29918262168843306061633714761200938536510344616796627465504988447607883544781,
+            -17369015046471995974106459814434955140906951195137422436589153304383829678254,
+            4629933841935227640030832847358321069483511526836766330421784648855905016507,
+        )
         assert c2.t == 0
 
         assert c2 == c1
@@ -71,9 +76,11 @@ class TestCurvePoint:
     def test_curve_point_mul_scalar(self):  # ✅
         c = self.a.mul_scalar(self.k)
 
-        assert c.x == 79885311972705142798326482969936249219924770158001168883491309517089224520499
-        assert c.y == -117978995929271306268700300631116017955026219006325540957535965864796039810533
-        assert c.z == 33296282955968814767393647671175158596516707523800561594047204110963892554884
+        assert c == CurvePoint(
+            79885311972705142798326482969936249219924770158001168883491309517089224520499,
+            -117978995929271306268700300631116017955026219006325540957535965864796039810533,
+            33296282955968814767393647671175158596516707523800561594047204110963892554884,
+        )
         assert c.t == 0
 
     def test_curve_point_mul_zero(self):  # ✅
@@ -120,3 +127,61 @@ class TestCurvePoint:
         assert c.y == -14554534243840831968271509262327092318269985762466049132223060768894044758975
         assert c.z == 37546741787101857219979687028463595807101726323092929554000333841513965935888
         assert c.t == 0
+
+    def test_curve_point_batch_make_affine(self):
+        points = [self.a.mul_scalar(self.k), self.a.copy(), CurvePoint.zero(), self.a.double()]
+        expected = [p.copy().make_affine() for p in points]
+        before = [(p.x, p.y, p.z) for p in points]
+        c = CurvePoint.batch_make_affine(points)
+        assert [(p.x, p.y, p.z) for p in points] == before
+        for p, q in zip(c, expected):
+            assert (p.x, p.y, p.z) == (q.x, q.y, q.z)
+
+    def test_curve_point_mul_scalar_window(self):
+        expected = self.a.mul_scalar(self.k)
+        for window in (2, 3, 6):
+            assert self.a.mul_scalar(self.k, window) == expected
+        assert self.a.mul_scalar(-self.k) == expected.negative()
+
+    def test_curve_point_endomorphism(self):
+        p = self.a.mul_scalar(self.k)
+        assert p.endomorphism() == p.mul_scalar(CURVE_LAMBDA)
+        assert CURVE_G.endomorphism().is_on_curve()
+
+    def test_curve_point_mul_scalar_glv(self):
+        k = ORDER - 12345678901234567890
+        expected = CurvePoint.zero()
+        for bit in bin(k)[2:]:
+            expected = expected.double()
+            if bit == "1":
+                expected = expected.add(CURVE_G)
+        assert CURVE_G.mul_scalar(k) == expected
+
+    def test_curve_point_double_scalar_mult(self):
+        a, b = ORDER - 12345678901234567890, 3980647517888122856822182160690720437624182590661027121449479086817936314326
+        q = CURVE_G.mul_scalar(77)
+        expected = CURVE_G.mul_scalar(a).add(q.mul_scalar(b))
+        assert CurvePoint.double_scalar_mult(a, CURVE_G, b, q) == expected
+        assert CurvePoint.double_scalar_mult(-a, CURVE_G, a, CURVE_G).is_infinity()
+        assert CurvePoint.double_scalar_mult(0, CURVE_G, 5, CurvePoint.zero()).is_infinity()
+
+    def test_curve_point_add_mixed(self):
+        p = self.a.mul_scalar(self.k)
+        q = CURVE_G.mul_scalar(12345).make_affine()
+        assert q.is_affine() and not p.is_affine()
+        assert p.add_mixed(q) == p.add(q.copy().double().add(q.negative()))
+        assert p.add_mixed(CURVE_G) == CURVE_G.add(p)
+        assert CurvePoint.zero().add_mixed(q) == q
+        assert q.add_mixed(q) == q.double()
+        assert q.add_mixed(q.negative()).is_infinity()
+
+    def test_curve_point_batch_sum(self):
+        p = self.a.mul_scalar(self.k)
+        q = CURVE_G.mul_scalar(12345)
+        points = [p, q, q.copy(), CurvePoint.zero(), p.negative(), CURVE_G, q.double()]
+        c = CurvePoint.batch_sum(points)
+        assert c == CURVE_G.mul_scalar(4 * 12345 + 1)
+        assert c.is_affine()
+        assert CurvePoint.batch_sum([p, p.negative()]).is_infinity()
+        assert CurvePoint.batch_sum([]).is_infinity()
+        assert CurvePoint.batch_sum([q]) == q
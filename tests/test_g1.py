@@ -1,3 +1,5 @@
+import pytest
+
 from bn256.constants import ORDER
 from bn256.curve import CurvePoint
 from bn256.g1 import G1
@@ -21,9 +23,11 @@ class TestG1:
     def test_g1_scalar_base_mult(self):  # ✅
         k = 47788134424157642025149506878156847317383594042762454755131214176563802632226
         a = G1.scalar_base_mult(k)
-        assert a.p.x == 23147198739377303696268760185879916104951352014158972815042481199518662237163
-        assert a.p.y == -137543789958245874112820606672873105444208967262602295734271787485976776532754
-        assert a.p.z == 26012546881300251529648179877688239169461623290701223441177116509219047587844
+        assert a.p == CurvePoint(
+            23147198739377303696268760185879916104951352014158972815042481199518662237163,
+            -137543789958245874112820606672873105444208967262602295734271787485976776532754,
+            26012546881300251529648179877688239169461623290701223441177116509219047587844,
+        )
 
     def test_g1_scalar_mult(self):  # ✅
         g1 = G1(
@@ -35,9 +39,11 @@ class TestG1:
         k = 3980647517888122856822182160690720437624182590661027121449479086817936314326
 
         h = g1.scalar_mult(k)
-        assert h.p.x == 33952822349928257784238991800298842573500493619101909799774918185543788070191
-        assert h.p.y == -127858765354401254179363456948505070216058303619048188702349533327242843083172
-        assert h.p.z == 13503192702291695420434473302267082624408933985548901619639552781433956149498
+        assert h.p == CurvePoint(
+            33952822349928257784238991800298842573500493619101909799774918185543788070191,
+            -127858765354401254179363456948505070216058303619048188702349533327242843083172,
+            13503192702291695420434473302267082624408933985548901619639552781433956149498,
+        )
 
     def test_g1_add(self):  # ✅
         a = G1(
@@ -113,4 +119,93 @@ class TestG1:
                 46990006276439800825058957394253553315977747486572295241013934648515217175438,
             )
         )
-        assert a.copy() == a
\ No newline at end of file
+        assert a.copy() == a
+
+    def test_g1_neg_marshal(self):
+        a = G1.base().neg()
+        b = G1.unmarshal(a.marshal())
+        assert b == a
+
+    def test_g1_batch_marshal(self):
+        points = [G1.scalar_base_mult(k) for k in (1, 2, 3, 0)]
+        assert G1.batch_marshal(points) == [g.marshal() for g in points]
+
+    def test_g1_precompute_base(self, monkeypatch):
+        monkeypatch.setattr(G1, "_base_table", None)
+        k = 47788134424157642025149506878156847317383594042762454755131214176563802632226
+        expected = G1.base().scalar_mult(k)
+        for window in (3, 7):
+            table = G1.precompute_base(window)
+            assert table.window == window
+            assert G1.scalar_base_mult(k) == expected
+            assert G1.scalar_base_mult(-k) == expected.neg()
+
+    def test_g1_multi_scalar_mult(self):
+        points = [G1.scalar_base_mult(i + 3) for i in range(5)]
+        scalars = [3980647517888122856822182160690720437624182590661027121449479086817936314326 * i for i in range(5)]
+        c = G1.multi_scalar_mult(points, scalars)
+        assert c == G1.scalar_base_mult(sum((i + 3) * k for i, k in enumerate(scalars)))
+        assert G1.multi_scalar_mult([], []).p.is_infinity()
+
+    def test_g1_double_scalar_mult(self):
+        a, b = 123456789, ORDER - 987654321
+        c = G1.double_scalar_mult(a, G1.base(), b, G1.scalar_base_mult(5))
+        assert c == G1.scalar_base_mult(a + 5 * b)
+
+    def test_g1_sum(self):
+        points = [G1.scalar_base_mult(i) for i in range(1, 12)]
+        c = G1.sum(iter(points))
+        assert c == G1.scalar_base_mult(66)
+        assert G1.sum([]).p.is_infinity()
+
+    def test_g1_marshal_compressed(self):
+        for k in (1, 2, 3, 47788134424157642025149506878156847317383594042762454755131214176563802632226):
+            a = G1.scalar_base_mult(k)
+            for p in (a, G1(a.p.negative())):
+                data = p.marshal_compressed()
+                assert len(data) == 32
+                assert G1.unmarshal_compressed(data) == p
+
+    def test_g1_marshal_compressed_infinity(self):
+        data = G1.scalar_base_mult(0).marshal_compressed()
+        assert data == bytes([0x40]) + bytes(31)
+        assert G1.unmarshal_compressed(data).p.is_infinity()
+
+    def test_g1_unmarshal_compressed_invalid(self):
+        data = G1.base().marshal_compressed()
+        with pytest.raises(ValueError):
+            G1.unmarshal_compressed(data[1:])
+        with pytest.raises(ValueError):
+            G1.unmarshal_compressed(bytes([data[0] & 0x3f]) + data[1:])
+        with pytest.raises(ValueError):
+            G1.unmarshal_compressed(bytes([0xbf]) + bytes([0xff]) * 31)
+
+    def test_g1_batch_unmarshal_compressed(self):
+        points = [G1.scalar_base_mult(k) for k in (5, 0, 7, 11)]
+        c = G1.batch_unmarshal_compressed([p.marshal_compressed() for p in points])
+        assert [p.marshal() for p in c] == [p.marshal() for p in points]
+        assert G1.batch_unmarshal_compressed([p.marshal_compressed() for p in points], trusted=True) == c
+        assert G1.unmarshal_compressed(points[0].marshal_compressed(), trusted=True) == points[0]
+        with pytest.raises(ValueError):
+            G1.batch_unmarshal_compressed([points[0].marshal_compressed(), bytes([0xbf]) + bytes([0xff]) * 31])
+
+    def test_g1_marshal_infinity(self):
+        data = G1.scalar_base_mult(0).marshal()
+        assert data == bytes(64)
+        assert G1.unmarshal(data).p.is_infinity()
+
+    def test_g1_unmarshal_invalid(self):
+        data = G1.base().marshal()
+        off_curve = data[:-1] + bytes([data[-1] ^ 1])
+        with pytest.raises(ValueError):
+            G1.unmarshal(off_curve)
+        with pytest.raises(ValueError):
+            G1.unmarshal(bytes([0xff]) * 64)
+        assert G1.unmarshal(off_curve, trusted=True).p.y == 3
+
+    def test_g1_hash_to_point(self):
+        dst = b"QUUX-V01-CS02-with-BN254G1_XMD:SHA-256_SVDW_RO_"
+        a = G1.hash_to_point(b"abc", dst)
+        assert a.p.is_on_curve()
+        assert G1.unmarshal(a.marshal()) == a
+        assert G1.batch_hash_to_point([b"abc", b""], dst)[0] == a
@@ -1,7 +1,9 @@
+import pytest
+
 from bn256.constants import ORDER
 from bn256.g2 import G2, TWIST_G
 from bn256.gfp2 import Gfp2
-from bn256.twist import TwistPoint
+from bn256.twist import TWIST_B, TwistPoint
 
 
 class TestG2:
@@ -50,12 +52,14 @@ class TestG2:
         a = G2.base()
         k = 32498273234
         c = a.scalar_mult(k)
-        assert c.p.x.x == 79342498918014555057659957993707594198152816625318490795384086866231378483238
-        assert c.p.x.y == 75064881631888316299786248174992043733548762922009969041763335514716661580046
-        assert c.p.y.x == -80971837679158956612470671613901869115198702943314042635428128476153813680368
-        assert c.p.y.y == -87766621548441252636986790424712567592503460630785843968260989606226302241177
-        assert c.p.z.x == 25982220755985358399738943490213691755613536187583364732600184316426166927358
-        assert c.p.z.y == 28839747431195664757690418033918501226209980182353693445864133946636662806562
+        assert c.p == TwistPoint(
+            Gfp2(79342498918014555057659957993707594198152816625318490795384086866231378483238,
+                 75064881631888316299786248174992043733548762922009969041763335514716661580046),
+            Gfp2(-80971837679158956612470671613901869115198702943314042635428128476153813680368,
+                 -87766621548441252636986790424712567592503460630785843968260989606226302241177),
+            Gfp2(25982220755985358399738943490213691755613536187583364732600184316426166927358,
+                 28839747431195664757690418033918501226209980182353693445864133946636662806562),
+        )
 
     def test_g2_identity(self):  # ✅
         g2 = G2.scalar_base_mult(ORDER)
@@ -76,3 +80,97 @@ class TestG2:
         c.p.make_affine()
 
         assert c == one
+
+    def test_g2_neg_marshal(self):
+        a = G2(G2.base().p.negative())
+        b = G2.unmarshal(a.marshal())
+        assert b == a
+
+    def test_g2_batch_marshal(self):
+        points = [G2.scalar_base_mult(k) for k in (1, 2, 3)]
+        assert G2.batch_marshal(points) == [g.marshal() for g in points]
+
+    def test_g2_precompute_base(self, monkeypatch):
+        monkeypatch.setattr(G2, "_base_table", None)
+        k = 47788134424157642025149506878156847317383594042762454755131214176563802632226
+        expected = G2.base().scalar_mult(k)
+        for window in (3, 7):
+            table = G2.precompute_base(window)
+            assert table.window == window
+            assert G2.scalar_base_mult(k) == expected
+            assert G2.scalar_base_mult(-k) == G2(expected.p.negative())
+
+    def test_g2_multi_scalar_mult(self):
+        points = [G2.scalar_base_mult(i + 3) for i in range(5)]
+        scalars = [3980647517888122856822182160690720437624182590661027121449479086817936314326 * i for i in range(5)]
+        c = G2.multi_scalar_mult(points, scalars)
+        assert c == G2.scalar_base_mult(sum((i + 3) * k for i, k in enumerate(scalars)))
+        assert G2.multi_scalar_mult([], []).p.is_infinity()
+
+    def test_g2_double_scalar_mult(self):
+        a, b = 123456789, ORDER - 987654321
+        c = G2.double_scalar_mult(a, G2.base(), b, G2.scalar_base_mult(5))
+        assert c == G2.scalar_base_mult(a + 5 * b)
+
+    def test_g2_sum(self):
+        points = [G2.scalar_base_mult(i) for i in range(1, 12)]
+        c = G2.sum(iter(points))
+        assert c == G2.scalar_base_mult(66)
+        assert G2.sum([]).p.is_infinity()
+
+    def test_g2_marshal_compressed(self):
+        for k in (1, 2, 3, 47788134424157642025149506878156847317383594042762454755131214176563802632226):
+            a = G2.scalar_base_mult(k)
+            for p in (a, G2(a.p.negative())):
+                data = p.marshal_compressed()
+                assert len(data) == 64
+                assert G2.unmarshal_compressed(data) == p
+
+    def test_g2_marshal_compressed_infinity(self):
+        data = G2.scalar_base_mult(0).marshal_compressed()
+        assert data == bytes([0x40]) + bytes(63)
+        assert G2.unmarshal_compressed(data).p.is_infinity()
+
+    def test_g2_unmarshal_compressed_invalid(self):
+        data = G2.base().marshal_compressed()
+        with pytest.raises(ValueError):
+            G2.unmarshal_compressed(data[1:])
+        with pytest.raises(ValueError):
+            G2.unmarshal_compressed(bytes([data[0] & 0x3f]) + data[1:])
+        with pytest.raises(ValueError):
+            G2.unmarshal_compressed(bytes([0xbf]) + bytes([0xff]) * 63)
+
+    def test_g2_batch_unmarshal_compressed(self):
+        points = [G2.scalar_base_mult(k) for k in (5, 0, 7, 11)]
+        c = G2.batch_unmarshal_compressed([p.marshal_compressed() for p in points])
+        assert [p.marshal() for p in c] == [p.marshal() for p in points]
+
+    def test_g2_marshal_infinity(self):
+        data = G2.scalar_base_mult(0).marshal()
+        assert data == bytes(128)
+        assert G2.unmarshal(data).p.is_infinity()
+
+    def test_g2_unmarshal_invalid(self):
+        data = G2.base().marshal()
+        with pytest.raises(ValueError):
+            G2.unmarshal(data[:-1] + bytes([data[-1] ^ 1]))
+        with pytest.raises(ValueError):
+            G2.unmarshal(bytes([0xff]) * 128)
+
+        # A point on the twist that is not in G2.
+        x = Gfp2(0, 1)
+        y = (x.square() * x + TWIST_B).sqrt()
+        p = G2(TwistPoint(x, y, Gfp2.one(), Gfp2.one()))
+        with pytest.raises(ValueError):
+            G2.unmarshal(p.marshal())
+        with pytest.raises(ValueError):
+            G2.unmarshal_compressed(p.marshal_compressed())
+        assert G2.unmarshal(p.marshal(), trusted=True).p.is_on_curve()
+        assert G2.unmarshal_compressed(p.marshal_compressed(), trusted=True) == p
+
+    def test_g2_hash_to_point(self):
+        dst = b"QUUX-V01-CS02-with-BN254G2_XMD:SHA-256_SVDW_RO_"
+        a = G2.hash_to_point(b"abc", dst)
+        assert a.p.is_in_subgroup()
+        assert G2.unmarshal(a.marshal()) == a
+        assert G2.batch_hash_to_point([b"abc", b""], dst)[0] == a
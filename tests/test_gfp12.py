@@ -1,9 +1,15 @@
-from bn256.constants import P
+from bn256.constants import P, U
 from bn256.gfp12 import Gfp12
 from bn256.gfp2 import Gfp2
 from bn256.gfp6 import Gfp6
 
 
+def _cyclotomic(a: Gfp12) -> Gfp12:
+    """_cyclotomic maps a to a^((p⁶-1)(p²+1)), an element of the cyclotomic subgroup."""
+    c = a.conjugate() * a.invert()
+    return c * c.frobenius_p2()
+
+
 class TestGfp12:
     a = Gfp12(
         x=Gfp6(
@@ -453,3 +459,57 @@ class TestGfp12:
         a = self.a.copy()
         a.minimal()
         assert a == self.a
+
+    def test_gfp12_mul_sparse(self):
+        a = self.k.x
+        b = self.k.y
+        c = self.k.z
+        line = Gfp12(Gfp6(Gfp2.zero(), a, b), Gfp6(Gfp2.zero(), Gfp2.zero(), c))
+        assert self.a.mul_sparse(a, b, c) == self.a * line
+
+    def test_gfp12_cyclotomic_square(self):
+        c = _cyclotomic(self.a)
+        assert c.cyclotomic_square() == c.square()
+        assert (c.cyclotomic_invert() * c).is_one()
+
+    def test_gfp12_cyclotomic_exp(self):
+        c = _cyclotomic(self.a)
+        assert c.cyclotomic_exp(self.k2) == c.exp(self.k2)
+        assert (c.cyclotomic_exp(-self.k2) * c.exp(self.k2)).is_one()
+
+    def test_gfp12_cyclotomic_exp_window(self):
+        c = _cyclotomic(self.a)
+        expected = c.exp(self.k2)
+        for window in (2, 3, 5):
+            assert c.cyclotomic_exp(self.k2, window) == expected
+        assert c.cyclotomic_exp(0).is_one()
+        assert c.cyclotomic_exp(1) == c
+
+    def test_gfp12_exp_by_u(self):
+        c = _cyclotomic(self.a)
+        assert c.exp_by_u() == c.exp(U)
+        assert c.conjugate().exp_by_u() == c.exp(U).conjugate()
+        assert Gfp12.one().exp_by_u().is_one()
+
+    def test_gfp12_compressed_square(self):
+        c = _cyclotomic(self.a)
+        sq = c.cyclotomic_square()
+        assert Gfp12.compressed_square(c.compress()) == sq.compress()
+        assert Gfp12.batch_decompress([c.compress(), sq.compress(), Gfp12.one().compress()]) == [c, sq, Gfp12.one()]
+
+    def test_gfp12_frobenius_p3(self):
+        assert self.a.frobenius_p3() == self.a.frobenius_p2().frobenius()
+        assert self.a.frobenius_p3().frobenius_p3() == self.a.frobenius_p2().frobenius_p2().frobenius_p2()
+
+    def test_gfp12_batch_invert(self):
+        elems = [self.a, Gfp12.zero(), self.b]
+        c = Gfp12.batch_invert(elems)
+        assert c[0] == self.a.invert()
+        assert c[1].is_zero()
+        assert c[2] == self.b.invert()
+
+    def test_gfp12_is_cyclotomic(self):
+        assert not (self.a.conjugate() * self.a.invert()).is_cyclotomic()
+        assert _cyclotomic(self.a).is_cyclotomic()
+        assert not self.a.is_cyclotomic()
+        assert not Gfp12.zero().is_cyclotomic()
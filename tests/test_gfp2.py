@@ -1,3 +1,5 @@
+import pytest
+
 from bn256.constants import P
 from bn256.gfp2 import Gfp2
 
@@ -303,9 +305,54 @@ class TestGfp2:  # ✅
         q_y = 2
 
         c = r_out_z.mul_scalar(q_y)
-        assert c.x == -26603378053267698290591090152788581539842415743978633623147819149957150808086
-        assert c.y == -42986773762136138550939841300994711483181945887289410488201774884862438778356
+        assert c == Gfp2(-26603378053267698290591090152788581539842415743978633623147819149957150808086,
+                         -42986773762136138550939841300994711483181945887289410488201774884862438778356)
 
         c = c.double()
-        assert c.x == -53206756106535396581182180305577163079684831487957267246295638299914301616172
-        assert c.y == -85973547524272277101879682601989422966363891774578820976403549769724877556712
+        assert c == Gfp2(-53206756106535396581182180305577163079684831487957267246295638299914301616172,
+                         -85973547524272277101879682601989422966363891774578820976403549769724877556712)
+
+    def test_gfp2_lazy_bound(self, monkeypatch):
+        from bn256.gfp2 import LAZY_BOUND
+        from bn256.g1 import G1
+        from bn256.g2 import G2
+        from bn256.gt import GT
+
+        operands = []
+        mul = Gfp2.mul
+
+        def recording_mul(a, b):
+            operands.extend([a.x, a.y, b.x, b.y])
+            return mul(a, b)
+
+        monkeypatch.setattr(Gfp2, 'mul', recording_mul)
+        GT.pair(G1.scalar_base_mult(123456789), G2.scalar_base_mult(987654321))
+        assert operands
+        assert all(-LAZY_BOUND < v < LAZY_BOUND for v in operands)
+
+    def test_gfp2_batch_invert(self):
+        elems = [self.a, Gfp2.zero(), self.b, Gfp2.one()]
+        assert Gfp2.batch_invert(elems) == [e.invert() for e in elems]
+
+    def test_gfp2_sqrt(self):
+        for a in (self.a, self.b, Gfp2(0, 5), Gfp2(0, P - 5), Gfp2(7, 0), Gfp2.zero()):
+            c = a.square().sqrt()
+            assert c == a or c == a.negative()
+
+    def test_gfp2_sqrt_non_square(self):
+        c = Gfp2(1, 3)
+        assert pow(c.x * c.x + c.y * c.y, (P - 1) // 2, P) == P - 1
+        with pytest.raises(ValueError):
+            c.sqrt()
+
+    def test_gfp2_batch_sqrt(self):
+        elems = [self.a, self.b, Gfp2(0, 2), self.a1]
+        roots = Gfp2.batch_sqrt([e.square() for e in elems])
+        for r, e in zip(roots, elems):
+            assert r.square() == e.square()
+
+    def test_gfp2_lexicographically_largest(self):
+        assert Gfp2(1, 0).lexicographically_largest() is False
+        assert Gfp2(-1, 0).lexicographically_largest() is True
+        assert Gfp2(0, -1).lexicographically_largest() is True
+        assert self.b.lexicographically_largest() != self.b.negative().lexicographically_largest()
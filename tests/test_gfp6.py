@@ -284,9 +284,25 @@ class TestGfp6:
                            21888242469167928346865582730235943648211751503989164634122797272405122712828)
         assert c.z == Gfp2(978236549263, 64893242)
 
+    def test_gfp6_frobenius_p3(self):
+        assert self.a.frobenius_p3() == self.a.frobenius_p2().frobenius()
+
     def test_gfp6_mul_gfp(self):  # ✅
         k = 23423492374
         c = self.a.mul_gfp(k)
         assert c.x == Gfp2(5609627504464257767634, 55191599861960730197534)
         assert c.y == Gfp2(1936180773313502468, 4279554595612405268110)
         assert c.z == Gfp2(22913716351629955820362, 1520026359111136508)
+
+    def test_gfp6_mul_by_01(self):
+        c0 = Gfp2(x=924523, y=12954623)
+        c1 = Gfp2(x=95421692834, y=236548)
+        assert self.a.mul_by_01(c0, c1) == self.a * Gfp6(Gfp2.zero(), c1, c0)
+
+    def test_gfp6_batch_invert(self):
+        elems = [self.a, Gfp6.zero(), self.b, Gfp6.one()]
+        invs = Gfp6.batch_invert(elems)
+        assert invs[0] == self.a.invert()
+        assert invs[1].is_zero()
+        assert invs[2] == self.b.invert()
+        assert invs[3].is_one()
@@ -1,10 +1,12 @@
+import pytest
+
 from bn256.constants import ORDER
 from bn256.g1 import G1, CURVE_G
 from bn256.g2 import G2, TWIST_G
 from bn256.gfp12 import Gfp12
 from bn256.gfp2 import Gfp2
 from bn256.gfp6 import Gfp6
-from bn256.gt import GT
+from bn256.gt import GT, GT_BUCKET_THRESHOLD, GT_COMPRESSED_LEN, GTBaseTable
 
 
 class TestGt:
@@ -63,18 +65,18 @@ class TestGt:
 
         c = a + b
 
-        assert c.p.x.x.x == -1675599505580013736848726344121663250734276380014938814643239428398383427547
-        assert c.p.x.x.y == -35744611921910172941095817410133694930319933112750369397334552137263894366632
-        assert c.p.x.y.x == 101140604317677357626288223352537256453784072168522189700482456447078954957556
-        assert c.p.x.y.y == 108438744683236932142052935739261815008410961165920235258725006451710922660940
-        assert c.p.x.z.x == -756660635688569433744331744979133479225638748551159684564162642701223381459
-        assert c.p.x.z.y == 67978123258108546253415081516926192439283403645684447051412366259995848190036
-        assert c.p.y.x.x == 177433364947782810261525258074678035169371486995644091103284402052241047252409
-        assert c.p.y.x.y == 114010638950055024841991636875904392724750054595206365541509001931206775869043
-        assert c.p.y.y.x == 6612076403231073280938514808254426931971544825286930605268340134271057321105
-        assert c.p.y.y.y == -227143030940355638229086131900420466253377659466909897401375250807239424834333
-        assert c.p.y.z.x == -179480661229626807863043969908327324427329158684947396186190800831404787264706
-        assert c.p.y.z.y == -106977123912702184488077907108866176808927617757024850174095162329605384275502
+        assert c.p.x.x == Gfp2(-1675599505580013736848726344121663250734276380014938814643239428398383427547,
+                               -35744611921910172941095817410133694930319933112750369397334552137263894366632)
+        assert c.p.x.y == Gfp2(101140604317677357626288223352537256453784072168522189700482456447078954957556,
+                               108438744683236932142052935739261815008410961165920235258725006451710922660940)
+        assert c.p.x.z == Gfp2(-756660635688569433744331744979133479225638748551159684564162642701223381459,
+                               67978123258108546253415081516926192439283403645684447051412366259995848190036)
+        assert c.p.y.x == Gfp2(177433364947782810261525258074678035169371486995644091103284402052241047252409,
+                               114010638950055024841991636875904392724750054595206365541509001931206775869043)
+        assert c.p.y.y == Gfp2(6612076403231073280938514808254426931971544825286930605268340134271057321105,
+                               -227143030940355638229086131900420466253377659466909897401375250807239424834333)
+        assert c.p.y.z == Gfp2(-179480661229626807863043969908327324427329158684947396186190800831404787264706,
+                               -106977123912702184488077907108866176808927617757024850174095162329605384275502)
 
         assert (
                 c.marshal().hex()
@@ -91,46 +93,46 @@ class TestGt:
     def test_gt_pair(self):  # ✅
         gt = GT.pair(G1(CURVE_G), G2(TWIST_G))
 
-        assert gt.p.x.x.x == -36291943388924125810871148410323613252911085699294832121685569512396245399159
-        assert gt.p.x.x.y == 6223602427219597392892794664899549544171383137467762280768257680446283161705
+        assert gt.p.x.x == Gfp2(-36291943388924125810871148410323613252911085699294832121685569512396245399159,
+                                6223602427219597392892794664899549544171383137467762280768257680446283161705)
 
-        assert gt.p.x.y.x == 302465985998980069233243018277462918705605420266482443426069781714222083500926
-        assert gt.p.x.y.y == 187250995013281090019227918185164790983548918774084783057291293800587056619394
+        assert gt.p.x.y == Gfp2(302465985998980069233243018277462918705605420266482443426069781714222083500926,
+                                187250995013281090019227918185164790983548918774084783057291293800587056619394)
 
-        assert gt.p.x.z.x == -397817446018798076550824682787176502305910133681866638444307054917272233798465
-        assert gt.p.x.z.y == -89391996343544369914205855114938870953972877139705901537124451996518938483034
+        assert gt.p.x.z == Gfp2(-397817446018798076550824682787176502305910133681866638444307054917272233798465,
+                                -89391996343544369914205855114938870953972877139705901537124451996518938483034)
 
-        assert gt.p.y.x.x == 107008395830933987319875472754396498301242693702719749747967098417581052532704
-        assert gt.p.y.x.y == 110076211846834985444035612218029711296102429575391508678500276293944720763033
+        assert gt.p.y.x == Gfp2(107008395830933987319875472754396498301242693702719749747967098417581052532704,
+                                110076211846834985444035612218029711296102429575391508678500276293944720763033)
 
-        assert gt.p.y.y.x == -160449336400777700034513612921010176052958261956909504495884912408289192387680
-        assert gt.p.y.y.y == 203559983940867568391418883211543700364762739957218507731082712914783762920285
+        assert gt.p.y.y == Gfp2(-160449336400777700034513612921010176052958261956909504495884912408289192387680,
+                                203559983940867568391418883211543700364762739957218507731082712914783762920285)
 
-        assert gt.p.y.z.x == 3758435817766288188804561253838670030762970764366672594784247447067868088068
-        assert gt.p.y.z.y == -341718551578644386583937402010528190091452755017035280651308399346002892829307
+        assert gt.p.y.z == Gfp2(3758435817766288188804561253838670030762970764366672594784247447067868088068,
+                                -341718551578644386583937402010528190091452755017035280651308399346002892829307)
 
     def test_gt_scalar_mult(self):  # ✅
         gt = GT.pair(G1(CURVE_G), G2(TWIST_G))
 
         k = 17789463703410470926570272169384173597171808111278036638494118056118083640224
         c = gt.scalar_mult(k)
-        assert c.p.x.x.x == -34454621411537811396419000207844179530742552944308194138398607173712656833168
-        assert c.p.x.x.y == -21953588207649719508288147153435313889034351427605038385661224268301153611034
+        assert c.p.x.x == Gfp2(-34454621411537811396419000207844179530742552944308194138398607173712656833168,
+                               -21953588207649719508288147153435313889034351427605038385661224268301153611034)
 
-        assert c.p.x.y.x == 217745519166078460502078494581152829823629842890098969815102087066120373922728
-        assert c.p.x.y.y == -26316854364201728941208639863193838999923401987959338910514846060123074428562
+        assert c.p.x.y == Gfp2(217745519166078460502078494581152829823629842890098969815102087066120373922728,
+                               -26316854364201728941208639863193838999923401987959338910514846060123074428562)
 
-        assert c.p.x.z.x == -18987486312259077480499762666619938179581377234911563046561223228988114094316
-        assert c.p.x.z.y == 42715018517234521727978176959278983733006088811721422199958171536568375761702
+        assert c.p.x.z == Gfp2(-18987486312259077480499762666619938179581377234911563046561223228988114094316,
+                               42715018517234521727978176959278983733006088811721422199958171536568375761702)
 
-        assert c.p.y.x.x == -87528031223368559840322799143719819928016464252755675330669990379807030726664
-        assert c.p.y.x.y == 50533217170173535234055942675660485110189284861033885063717191950645918071037
+        assert c.p.y.x == Gfp2(-87528031223368559840322799143719819928016464252755675330669990379807030726664,
+                               50533217170173535234055942675660485110189284861033885063717191950645918071037)
 
-        assert c.p.y.y.x == -39545588102489648655147050747791306550600884044653756147595029687444329207088
-        assert c.p.y.y.y == 4940683273863713877844059522028220042832258426496958174158510206134364513610
+        assert c.p.y.y == Gfp2(-39545588102489648655147050747791306550600884044653756147595029687444329207088,
+                               4940683273863713877844059522028220042832258426496958174158510206134364513610)
 
-        assert c.p.y.z.x == 138563105374586778204689916708325159450268756510221312351517913760840016372735
-        assert c.p.y.z.y == -143083691858367263810097829518744594043710804588827602407021776947150047075454
+        assert c.p.y.z == Gfp2(138563105374586778204689916708325159450268756510221312351517913760840016372735,
+                               -143083691858367263810097829518744594043710804588827602407021776947150047075454)
 
     def test_gt_marshal(self):  # ✅
         gt = GT.base()
@@ -143,6 +145,50 @@ class TestGt:
         c = gt.scalar_mult(ORDER)
         assert c.p.is_one()
 
+    def test_gt_scalar_mult_frobenius(self):
+        g = GT.base().scalar_mult(12345)
+        for k in (17789463703410470926570272169384173597171808111278036638494118056118083640224, 3, ORDER - 1, -5):
+            assert g.scalar_mult(k).p == g.p.cyclotomic_exp(k)
+        assert g.scalar_mult(0).p.is_one()
+
+    def test_gt_base(self):
+        assert GT.base() == GT.pair(G1.base(), G2.base())
+        assert GT.base().p == GT.base().p
+        expected = GT.base().p.copy()
+        GT.base().p.set_one()
+        assert GT.base().p == expected
+
+    def test_gt_scalar_base_mult(self):
+        k = 17789463703410470926570272169384173597171808111278036638494118056118083640224
+        expected = GT.base().p.cyclotomic_exp(k)
+        assert GT.scalar_base_mult(k).p == expected
+        assert GT.base().scalar_mult(k).p == expected
+        assert GT(GT.base().p.copy()).scalar_mult(k).p == expected
+        assert GT.scalar_base_mult(k + ORDER).p == expected
+        assert GT.scalar_base_mult(0).p.is_one()
+        table = GTBaseTable(GT.base().p, window=3)
+        assert table.exp(k) == expected
+
+    def test_gt_random_gt(self):
+        k1, k2, gt = GT.random_gt()
+        assert gt == GT.pair(G1.scalar_base_mult(k1), G2.scalar_base_mult(k2))
+
+    def test_gt_multi_exp(self):
+        elements = [GT.scalar_base_mult(i + 3) for i in range(5)] + [GT.pair(G1.base(), G2.base())]
+        scalars = [3980647517888122856822182160690720437624182590661027121449479086817936314326 * i for i in range(5)]
+        scalars.append(-7)
+        c = GT.multi_exp(elements, scalars)
+        assert c == GT.scalar_base_mult(sum((i + 3) * k for i, k in enumerate(scalars[:5])) - 7)
+        assert GT.multi_exp([], []).p.is_one()
+        assert GT.multi_exp([GT.base()], [ORDER]).p.is_one()
+
+    def test_gt_multi_exp_buckets(self):
+        n = GT_BUCKET_THRESHOLD + 1
+        elements = [GT.scalar_base_mult(i + 2) for i in range(n)]
+        scalars = [ORDER - 1234567 * (i + 1) ** 5 for i in range(n)]
+        c = GT.multi_exp(elements, scalars)
+        assert c == GT.scalar_base_mult(sum((i + 2) * k for i, k in enumerate(scalars)))
+
     def test_gt_pair_from_bytes(self):
         g1 = G1.unmarshal(
             bytes.fromhex(
@@ -192,16 +238,109 @@ class TestGt:
             "3e632c8b6de5c9481fec5afe073c29b07d58ca96c387337574512ee4cad49d2c43bc07c6961a5f2be948057764179c55997b4c7577"
             "c3458c6f4f80aaeb2c0e2dd4e0"))
         c = a.neg()
-        assert c.p.x.x.x == 14316889936360775573063782199955136620748696934567389278493854635990941529470
-        assert c.p.x.x.y == -8875583321461917538016506158842471378662626717988281300425087430263288369425
-        assert c.p.x.y.x == 840772891883592954862493164809583603081275527185496467455301949965306659527
-        assert c.p.x.y.y == -2879453619811306993738526652188367096841862177474511923205635076166226681463
-        assert c.p.x.z.x == 1152363383369962367967589652012049579299608275450536177078528439123854932029
-        assert c.p.x.z.y == 18722600820785196488403578793824501086969061263263991684231878334000966532671
-
-        assert c.p.y.x.x == -14286730107705827259019061190034784508244776844504917963891433690391696032996
-        assert c.p.y.x.y == 5893116094900687371145148053546216033780975613849724601615137439427568132808
-        assert c.p.y.y.x == -7927458341180310737856427256245612170866936906790565604284846102508220945519
-        assert c.p.y.y.y == 5609923857583508975437673496430547119284185344018297891473469295646206344803
-        assert c.p.y.z.x == 20148115565044944465305967235599620785528754394169863105440072854891142071228
-        assert c.p.y.z.y == 3517061631842348497509319922834162465335179801789384092924078400775801132256
+        assert c.p.x.x == Gfp2(14316889936360775573063782199955136620748696934567389278493854635990941529470,
+                               -8875583321461917538016506158842471378662626717988281300425087430263288369425)
+        assert c.p.x.y == Gfp2(840772891883592954862493164809583603081275527185496467455301949965306659527,
+                               -2879453619811306993738526652188367096841862177474511923205635076166226681463)
+        assert c.p.x.z == Gfp2(1152363383369962367967589652012049579299608275450536177078528439123854932029,
+                               18722600820785196488403578793824501086969061263263991684231878334000966532671)
+
+        assert c.p.y.x == Gfp2(-14286730107705827259019061190034784508244776844504917963891433690391696032996,
+                               5893116094900687371145148053546216033780975613849724601615137439427568132808)
+        assert c.p.y.y == Gfp2(-7927458341180310737856427256245612170866936906790565604284846102508220945519,
+                               5609923857583508975437673496430547119284185344018297891473469295646206344803)
+        assert c.p.y.z == Gfp2(20148115565044944465305967235599620785528754394169863105440072854891142071228,
+                               3517061631842348497509319922834162465335179801789384092924078400775801132256)
+
+    def test_gt_pair_product(self):
+        k1, a = G1.random_g1()
+        k2, b = G2.random_g2()
+        c = GT.pair_product([(a, b), (G1.base(), G2.base())])
+        assert c == GT.pair(a, b) + GT.base()
+
+    def test_gt_lazy(self):
+        a = GT.pair(G1.scalar_base_mult(3), G2.base())
+        b = GT.pair(G1.base(), G2.scalar_base_mult(5))
+        assert a.is_lazy() and b.is_lazy()
+        c = a + b + GT.base()
+        assert c.is_lazy()
+        assert c == GT.base().scalar_mult(9)
+        assert c != GT.base().scalar_mult(8)
+        assert c.is_lazy()
+        assert c.finalize() is c and not c.is_lazy()
+        assert c.marshal() == GT.base().scalar_mult(9).marshal()
+
+    def test_gt_lazy_mixed(self):
+        a = GT.pair(G1.scalar_base_mult(7), G2.base())
+        b = GT.base().scalar_mult(4).finalize()
+        c = a + b
+        assert c.is_lazy()
+        assert c == GT.base().scalar_mult(11)
+        assert c.neg() == GT.base().scalar_mult(ORDER - 11)
+        assert (c + c.neg()).p.is_one()
+        assert GT().p.is_one()
+
+    def test_gt_pairing_check(self):
+        k, a = G1.random_g1()
+        b = G2.scalar_base_mult(k)
+        assert GT.pairing_check([(a, G2.base()), (G1.base().neg(), b)])
+        assert not GT.pairing_check([(a, G2.base()), (G1.base(), b)])
+        assert GT.pairing_check([(G1.scalar_base_mult(0), b)])
+
+    def test_gt_pair_prepared(self):
+        k, a = G1.random_g1()
+        b = G2.base().prepare()
+        assert GT.pair(a, b) == GT.pair(a, G2.base())
+        assert GT.pairing_check([(a, b), (G1.base().neg(), G2.scalar_base_mult(k).prepare())])
+
+    def test_gt_marshal_compressed(self):
+        a = GT.pair(G1.scalar_base_mult(3), G2.scalar_base_mult(5))
+        data = a.marshal_compressed()
+        assert len(data) == GT_COMPRESSED_LEN == 193
+        assert data[0] == 0x01
+        assert GT.unmarshal_compressed(data) == a
+        assert GT.unmarshal_compressed(a.neg().marshal_compressed()) == a.neg()
+
+    def test_gt_marshal_compressed_identity(self):
+        data = GT(Gfp12.one()).marshal_compressed()
+        assert data == bytes([0x81]) + bytes(192)
+        assert GT.unmarshal_compressed(data).p.is_one()
+
+    def test_gt_batch_marshal_compressed(self):
+        a = GT.pair(G1.base(), G2.base())
+        elems = [a, GT(Gfp12.one()), a.add(a), a.neg()]
+        data = GT.batch_marshal_compressed(elems)
+        assert data == [e.marshal_compressed() for e in elems]
+        assert [e.marshal() for e in GT.batch_unmarshal_compressed(data)] == [e.marshal() for e in elems]
+
+    def test_gt_unmarshal_compressed_invalid(self):
+        data = GT.pair(G1.base(), G2.base()).marshal_compressed()
+        for bad in (data[:-1], bytes([0x02]) + data[1:], bytes([0x81]) + data[1:], data[:1] + bytes([0xff]) * 192):
+            with pytest.raises(ValueError):
+                GT.unmarshal_compressed(bad)
+
+    def test_gt_is_in_subgroup(self):
+        a = GT.pair(G1.base(), G2.base())
+        assert a.is_in_subgroup()
+        assert GT(Gfp12.one()).is_in_subgroup()
+
+        f = Gfp12(Gfp6(Gfp2(1, 2), Gfp2(3, 4), Gfp2(5, 6)), Gfp6(Gfp2(7, 8), Gfp2(9, 10), Gfp2(11, 12)))
+        assert not GT(f).is_in_subgroup()
+        # Cyclotomic, but not in the order-ORDER subgroup.
+        c = f.conjugate() * f.invert()
+        c = c * c.frobenius_p2()
+        assert c.is_cyclotomic()
+        assert not GT(c).is_in_subgroup()
+        assert not (c ** ORDER).is_one()
+
+    def test_gt_unmarshal_invalid(self):
+        f = Gfp12(Gfp6(Gfp2(1, 2), Gfp2(3, 4), Gfp2(5, 6)), Gfp6(Gfp2(7, 8), Gfp2(9, 10), Gfp2(11, 12)))
+        c = f.conjugate() * f.invert()
+        c = GT(c * c.frobenius_p2())
+        for data in (c.marshal(), GT(f).marshal(), bytes([0xff]) * 384, bytes(384)):
+            with pytest.raises(ValueError):
+                GT.unmarshal(data)
+        assert GT.unmarshal(c.marshal(), trusted=True) == c
+        with pytest.raises(ValueError):
+            GT.unmarshal_compressed(c.marshal_compressed())
+        assert GT.unmarshal_compressed(c.marshal_compressed(), trusted=True) == c
@@ -0,0 +1,87 @@
+from bn256.constants import P
+from bn256.curve import CurvePoint
+from bn256.gfp2 import Gfp2
+from bn256.hash_to_curve import (_sgn0_2, batch_hash_to_g1, batch_hash_to_g2, batch_map_to_curve_svdw,
+                                 batch_map_to_twist_svdw, clear_cofactor_g2, expand_message_xmd, hash_to_field,
+                                 hash_to_g1, hash_to_g2, map_to_curve_svdw, map_to_twist_svdw)
+from bn256.twist import TWIST_B, TwistPoint
+
+
+class TestHashToCurve:
+    dst = b"QUUX-V01-CS02-with-BN254G1_XMD:SHA-256_SVDW_RO_"
+
+    def test_expand_message_xmd(self):
+        dst = b"QUUX-V01-CS02-with-expander-SHA256-128"
+        assert expand_message_xmd(b"", dst, 0x20).hex() == (
+            "68a985b87eb6b46952128911f2a4412bbc302a9d759667f87f7a21d803f07235")
+        assert expand_message_xmd(b"abc", dst, 0x20).hex() == (
+            "d8ccab23b5985ccea865c6c97b6e5b8350e794e603b4b97902f53a8a0d605615")
+        assert expand_message_xmd(b"", dst, 0x80).hex().startswith("af84c27ccfd45d41914fdff5df25293e221afc53d8ad2ac0")
+
+    def test_hash_to_field(self):
+        us = hash_to_field(b"", self.dst, 2)
+        assert us == [
+            0x2f87b81d9d6ef05ad4d249737498cc27e1bd485dca804487844feb3c67c1a9b5,
+            0x06de2d0d7c0d9c7a5a6c0b74675e7543f5b98186b5dbf831067449000b2b1f8e,
+        ]
+
+    def test_map_to_curve_svdw(self):
+        for u in (0, 1, P - 1, 12345678901234567890, hash_to_field(b"", self.dst, 1)[0]):
+            p = map_to_curve_svdw(u)
+            assert p.is_on_curve()
+            assert p.y % 2 == u % 2
+
+    def test_batch_map_to_curve_svdw(self):
+        us = [3, 0, 5, P - 2]
+        assert batch_map_to_curve_svdw(us) == [map_to_curve_svdw(u) for u in us]
+
+    def test_hash_to_g1(self):
+        p = hash_to_g1(b"", self.dst)
+        assert p == CurvePoint(
+            0x0a976ab906170db1f9638d376514dbf8c42aef256a54bbd48521f20749e59e86,
+            0x02925ead66b9e68bfc309b014398640ab55f6619ab59bc1fab2210ad4c4d53d5,
+        )
+        assert hash_to_g1(b"abc", self.dst) != p
+        assert hash_to_g1(b"", b"other-dst") != p
+
+    def test_batch_hash_to_g1(self):
+        msgs = [b"", b"abc", b"abcdef0123456789"]
+        assert batch_hash_to_g1(msgs, self.dst) == [hash_to_g1(m, self.dst) for m in msgs]
+
+    def test_map_to_twist_svdw(self):
+        for u in (Gfp2(0, 0), Gfp2(0, 1), Gfp2(1, 0), Gfp2(P - 1, 7), Gfp2(12345678901234567890, 98765)):
+            q = map_to_twist_svdw(u)
+            assert q.is_on_curve()
+            assert _sgn0_2(q.y) == _sgn0_2(u)
+
+    def test_batch_map_to_twist_svdw(self):
+        us = [Gfp2(3, 1), Gfp2(0, 0), Gfp2(5, P - 2)]
+        assert batch_map_to_twist_svdw(us) == [map_to_twist_svdw(u) for u in us]
+
+    def test_clear_cofactor_g2(self):
+        # (i, y) lies on the twist but outside G₂.
+        x = Gfp2(1, 0)
+        y = (x.square() * x + TWIST_B).sqrt()
+        q = TwistPoint(x, y, Gfp2.one(), Gfp2.one())
+        assert q.is_on_curve() and not q.is_in_subgroup()
+        r = clear_cofactor_g2(q).make_affine()
+        assert r.is_on_curve() and r.is_in_subgroup()
+
+    def test_hash_to_g2(self):
+        dst = b"QUUX-V01-CS02-with-BN254G2_XMD:SHA-256_SVDW_RO_"
+        q = hash_to_g2(b"", dst)
+        assert q.is_affine() and q.is_on_curve() and q.is_in_subgroup()
+        # Gfp2(imaginary, real) coordinates.
+        assert q.x == Gfp2(0x1747d950a6f23c16156e2171bce95d1189b04148ad12628869ed21c96a8c9335,
+                           0x1192005a0f121921a6d5629946199e4b27ff8ee4d6dd4f9581dc550ade851300)
+        assert q.y == Gfp2(0x2c9755350ca363ef2cf541005437221c5740086c2e909b71d075152484e845f4,
+                           0x0498f6bb5ac309a07d9a8b88e6ff4b8de0d5f27a075830e1eb0e68ea318201d8)
+        r = hash_to_g2(b"abc", dst)
+        assert r.x == Gfp2(0x0b5db3ca7e8ef5edf3a33dfc3242357fbccead98099c3eb564b3d9d13cba4efd,
+                           0x16c88b54eec9af86a41569608cd0f60aab43464e52ce7e6e298bf584b94fccd2)
+        assert r.y == Gfp2(0x22d02d2da7f288545ff8789e789902245ab08c6b1d253561eec789ec2c1bd630,
+                           0x1c42ba524cb74db8e2c680449746c028f7bea923f245e69f89256af2d6c5f3ac)
+        assert hash_to_g2(b"", dst) == q
+        assert hash_to_g2(b"abc", dst) != q
+        msgs = [b"", b"abc", b"abcdef0123456789"]
+        assert batch_hash_to_g2(msgs, dst) == [hash_to_g2(m, dst) for m in msgs]
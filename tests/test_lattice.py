@@ -0,0 +1,29 @@
+from bn256.constants import ORDER, P
+from bn256.curve import CURVE_LAMBDA
+from bn256.lattice import CURVE_LATTICE, TWIST_LATTICE
+
+
+class TestLattice:
+    k = 47788134424157642025149506878156847317383594042762454755131214176563802632226
+
+    def test_curve_lattice_vectors(self):
+        for a, b in CURVE_LATTICE.vectors:
+            assert (a + b * CURVE_LAMBDA) % ORDER == 0
+
+    def test_curve_lattice_decompose(self):
+        for k in (0, 1, ORDER - 1, self.k % ORDER, 1 << 253):
+            k1, k2 = CURVE_LATTICE.decompose(k)
+            assert (k1 + k2 * CURVE_LAMBDA - k) % ORDER == 0
+            assert abs(k1).bit_length() <= 128
+            assert abs(k2).bit_length() <= 128
+
+    def test_twist_lattice_vectors(self):
+        for v in TWIST_LATTICE.vectors:
+            assert sum(a * pow(P, i, ORDER) for i, a in enumerate(v)) % ORDER == 0
+
+    def test_twist_lattice_decompose(self):
+        for k in (0, 1, ORDER - 1, self.k % ORDER, 1 << 253):
+            parts = TWIST_LATTICE.decompose(k)
+            assert len(parts) == 4
+            assert (sum(a * pow(P, i, ORDER) for i, a in enumerate(parts)) - k) % ORDER == 0
+            assert max(abs(a).bit_length() for a in parts) <= 66
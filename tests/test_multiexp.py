@@ -0,0 +1,68 @@
+from bn256.curve import CURVE_G, CurvePoint
+from bn256.multiexp import FixedBaseTable, bucket_window, interleaved_wnaf, odd_multiples, pippenger, signed_digits
+from bn256.twist import TWIST_G, TwistPoint
+
+
+class TestMultiexp:
+    k1 = 47788134424157642025149506878156847317383594042762454755131214176563802632226
+    k2 = 3980647517888122856822182160690720437624182590661027121449479086817936314326
+
+    def test_odd_multiples(self):
+        table = odd_multiples(CURVE_G, 4)
+        assert len(table) == 4
+        for i, p in enumerate(table):
+            assert p == CURVE_G.double().mul_scalar(i) + CURVE_G if i else p == CURVE_G
+
+    def test_interleaved_wnaf(self):
+        p = CURVE_G.double()
+        c = interleaved_wnaf([CURVE_G, p], [self.k1, -self.k2], CurvePoint.zero(), 4)
+        assert c == CURVE_G.mul_scalar(self.k1) + p.mul_scalar(self.k2).negative()
+
+    def test_interleaved_wnaf_twist(self):
+        c = interleaved_wnaf([TWIST_G, TWIST_G], [self.k1, self.k2], TwistPoint.zero(), 3)
+        assert c == TWIST_G.mul_scalar(self.k1 + self.k2)
+
+    def test_interleaved_wnaf_empty(self):
+        assert interleaved_wnaf([], [], CurvePoint.zero()).is_infinity()
+        assert interleaved_wnaf([CURVE_G], [0], CurvePoint.zero()).is_infinity()
+
+    def test_signed_digits(self):
+        for window in (2, 4, 6):
+            digits = signed_digits(self.k1, window)
+            assert sum(d << (window * i) for i, d in enumerate(digits)) == self.k1
+            assert all(-(1 << (window - 1)) <= d < (1 << (window - 1)) for d in digits)
+        assert signed_digits(0, 4) == []
+
+    def test_fixed_base_table(self):
+        table = FixedBaseTable(CURVE_G, CurvePoint.zero(), 4)
+        assert table.mul(0).is_infinity()
+        assert table.mul(1) == CURVE_G
+        assert table.mul(self.k2) == CURVE_G.mul_scalar(self.k2)
+        assert CURVE_G == CurvePoint(1, 2)
+
+    def test_fixed_base_table_twist(self):
+        table = FixedBaseTable(TWIST_G, TwistPoint.zero(), 3)
+        assert table.mul(self.k2) == TWIST_G.mul_scalar(self.k2)
+
+    def test_bucket_window(self):
+        assert bucket_window(1) == 2
+        windows = [bucket_window(n) for n in (1, 10, 100, 1000, 100000)]
+        assert windows == sorted(windows)
+
+    def test_pippenger(self):
+        points = [CURVE_G.mul_scalar(i + 1) for i in range(12)]
+        scalars = [self.k1 * (i + 1) - self.k2 for i in range(12)]
+        expected = CurvePoint.zero()
+        for p, k in zip(points, scalars):
+            expected = expected.add(p.mul_scalar(k))
+        for window in (None, 2, 5):
+            assert pippenger(points, scalars, CurvePoint.zero(), window) == expected
+
+    def test_pippenger_twist(self):
+        points = [TWIST_G, TWIST_G.double(), TwistPoint.zero()]
+        c = pippenger(points, [self.k1, self.k2, self.k1], TwistPoint.zero())
+        assert c == TWIST_G.mul_scalar(self.k1 + 2 * self.k2)
+
+    def test_pippenger_empty(self):
+        assert pippenger([], [], CurvePoint.zero()).is_infinity()
+        assert pippenger([CURVE_G, CURVE_G], [1, -1], CurvePoint.zero()).is_infinity()
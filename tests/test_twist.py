@@ -1,5 +1,7 @@
+from bn256.constants import ORDER, P
 from bn256.gfp2 import Gfp2
-from bn256.twist import TwistPoint, TWIST_G
+from bn256.multiexp import interleaved_wnaf
+from bn256.twist import TWIST_B, TwistPoint, TWIST_G
 
 
 class TestTwistPoint:
@@ -60,14 +62,14 @@ class TestTwistPoint:
     def test_twist_point_mul_scalar(self):
         k = 32498273234
         c = TWIST_G.mul_scalar(k)
-        assert c.x.x == 79342498918014555057659957993707594198152816625318490795384086866231378483238
-        assert c.x.y == 75064881631888316299786248174992043733548762922009969041763335514716661580046
-
-        assert c.y.x == -80971837679158956612470671613901869115198702943314042635428128476153813680368
-        assert c.y.y == -87766621548441252636986790424712567592503460630785843968260989606226302241177
-
-        assert c.z.x == 25982220755985358399738943490213691755613536187583364732600184316426166927358
-        assert c.z.y == 28839747431195664757690418033918501226209980182353693445864133946636662806562
+        assert c == TwistPoint(
+            Gfp2(79342498918014555057659957993707594198152816625318490795384086866231378483238,
+                 75064881631888316299786248174992043733548762922009969041763335514716661580046),
+            Gfp2(-80971837679158956612470671613901869115198702943314042635428128476153813680368,
+                 -87766621548441252636986790424712567592503460630785843968260989606226302241177),
+            Gfp2(25982220755985358399738943490213691755613536187583364732600184316426166927358,
+                 28839747431195664757690418033918501226209980182353693445864133946636662806562),
+        )
 
     def test_twist_point_mul_zero(self):
         k = 0
@@ -92,3 +94,72 @@ class TestTwistPoint:
         )
         c = a.copy().make_affine()
         assert c == a
+
+    def test_twist_point_batch_make_affine(self):
+        points = [TWIST_G.mul_scalar(32498273234), TWIST_G, TwistPoint.zero(), TWIST_G.double()]
+        expected = [p.copy().make_affine() for p in points]
+        before = [(p.x.copy(), p.y.copy(), p.z.copy()) for p in points]
+        c = TwistPoint.batch_make_affine(points)
+        assert [(p.x, p.y, p.z) for p in points] == before
+        for p, q in zip(c, expected):
+            assert (p.x, p.y, p.z) == (q.x, q.y, q.z)
+
+    def test_twist_point_mul_scalar_window(self):
+        k = 32498273234
+        expected = TWIST_G.mul_scalar(k)
+        for window in (2, 3, 6):
+            assert TWIST_G.mul_scalar(k, window) == expected
+        assert TWIST_G.mul_scalar(-k) == expected.negative()
+
+    def test_twist_point_psi(self):
+        q = TWIST_G.mul_scalar(32498273234)
+        c = q.psi()
+        assert c.copy().make_affine().is_on_curve()
+        assert c == q.mul_scalar(P)
+        assert TwistPoint.zero().psi().is_infinity()
+
+    def test_twist_point_mul_scalar_gls(self):
+        k = ORDER - 47788134424157642025149506878156847317383594042762454755131214176563802632226 % ORDER
+        expected = interleaved_wnaf([TWIST_G], [k], TwistPoint.zero())
+        assert TWIST_G.mul_scalar(k) == expected
+        assert TWIST_G.mul_scalar(ORDER).is_infinity()
+
+    def test_twist_point_double_scalar_mult(self):
+        a, b = ORDER - 12345678901234567890, 3980647517888122856822182160690720437624182590661027121449479086817936314326
+        q = TWIST_G.mul_scalar(77)
+        expected = TWIST_G.mul_scalar(a).add(q.mul_scalar(b))
+        assert TwistPoint.double_scalar_mult(a, TWIST_G, b, q) == expected
+        assert TwistPoint.double_scalar_mult(-a, TWIST_G, a, TWIST_G).is_infinity()
+
+    def test_twist_point_add_mixed(self):
+        p = TWIST_G.mul_scalar(32498273234)
+        q = TWIST_G.mul_scalar(12345).make_affine()
+        assert q.is_affine() and not p.is_affine()
+        assert p.add_mixed(q) == p.add(q.double().add(q.negative()))
+        assert p.add_mixed(TWIST_G) == TWIST_G.add(p)
+        assert TwistPoint.zero().add_mixed(q) == q
+        assert q.add_mixed(q) == q.double()
+        assert q.add_mixed(q.negative()).is_infinity()
+
+    def test_twist_point_batch_sum(self):
+        p = TWIST_G.mul_scalar(32498273234)
+        q = TWIST_G.mul_scalar(12345)
+        points = [p, q, q.copy(), TwistPoint.zero(), p.negative(), TWIST_G, q.double()]
+        c = TwistPoint.batch_sum(points)
+        assert c == TWIST_G.mul_scalar(4 * 12345 + 1)
+        assert c.is_affine()
+        assert TwistPoint.batch_sum([p, p.negative()]).is_infinity()
+        assert TwistPoint.batch_sum([]).is_infinity()
+
+    def test_twist_point_is_in_subgroup(self):
+        assert TWIST_G.is_in_subgroup()
+        assert TWIST_G.mul_scalar(32498273234).is_in_subgroup()
+        assert TwistPoint.zero().is_in_subgroup()
+
+        y = (Gfp2(0, 1).square() * Gfp2(0, 1) + TWIST_B).sqrt()
+        p = TwistPoint(Gfp2(0, 1), y, Gfp2.one(), Gfp2.one())
+        assert p.is_on_curve()
+        assert not p.is_in_subgroup()
+        assert not p.add(TWIST_G).is_in_subgroup()
+        # p times ORDER is in the cofactor part only.
+        assert not interleaved_wnaf([p], [ORDER], TwistPoint.zero()).is_in_subgroup()
@@ -1,5 +1,8 @@
+import pytest
+
 from bn256.constants import P
-from bn256.utils import bits_of, mod_inverse
+from bn256.utils import (COMPRESSED_INFINITY, COMPRESSED_LARGEST, batch_mod_inverse, bits_of,
+                         mod_inverse, set_flags, split_flags, wnaf)
 
 
 class TestUtils:
@@ -14,3 +17,29 @@ class TestUtils:
         k = 32498273234
         r = mod_inverse(k, P)
         assert r == 5113278667736460357814589262896754087238737747850571709981590827357930058526
+
+    def test_batch_mod_inverse(self):
+        values = [32498273234, 0, P - 1, 7, P + 7]
+        assert batch_mod_inverse(values, P) == [mod_inverse(v, P) for v in values]
+        assert batch_mod_inverse([], P) == []
+
+    def test_wnaf(self):
+        k = 32498273234
+        for w in (2, 4, 5):
+            digits = wnaf(k, w)
+            assert sum(d << i for i, d in enumerate(digits)) == k
+            assert all(d % 2 == 1 and abs(d) < 1 << (w - 1) for d in digits if d != 0)
+        assert wnaf(k, 2) == [0, 1, 0, 0, 1, 0, -1, 0, 0, 0, -1, 0, 1, 0, 1, 0, 0, 0, -1, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1,
+                              0, 0, -1, 0, 0, 0, 1]
+        assert wnaf(0, 4) == []
+
+    def test_split_flags(self):
+        data = set_flags(bytes([0x12]) + bytes(31), COMPRESSED_LARGEST)
+        assert data[0] == 0xd2
+        assert split_flags(data, 32) == (COMPRESSED_LARGEST, bytes([0x12]) + bytes(31))
+        assert split_flags(set_flags(bytes(32), COMPRESSED_INFINITY), 32) == (COMPRESSED_INFINITY, bytes(32))
+
+    def test_split_flags_invalid(self):
+        for data, size in ((bytes(32), 32), (bytes([0xc0]) + bytes(30), 32), (bytes([0x40]) + bytes(30) + b"\x01", 32)):
+            with pytest.raises(ValueError):
+                split_flags(data, size)